@@ -7,6 +7,71 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+
+_NUMBERED_BACKREF_RE = re.compile(r"\\[1-9]")
+
+
+@lru_cache(maxsize=32)
+def _combine_patterns(patterns: tuple[str, ...]) -> re.Pattern | None:
+    """Compile a category's patterns into one alternation (None if impossible).
+
+    A leading ``(?i)`` is turned into a scoped ``(?i:...)`` group so each
+    pattern keeps its own flags.  Patterns with numbered backreferences (which
+    would be renumbered) or clashing group names are not combined.  Keyed on
+    the pattern strings, so any change to a pattern list is picked up.
+    """
+    if any(_NUMBERED_BACKREF_RE.search(p) for p in patterns):
+        return None
+    parts = [
+        f"(?i:{p[4:]})" if p.startswith("(?i)") else f"(?:{p})" for p in patterns
+    ]
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+def _matches_any(patterns: tuple[str, ...], text: str) -> bool:
+    """Return True if any of the regex *patterns* matches *text*."""
+    if not patterns:
+        return False
+    combined = _combine_patterns(patterns)
+    if combined is not None:
+        return combined.search(text) is not None
+    return any(re.search(p, text) for p in patterns)
+
+
+# Categories in the order they are tried, with the class attribute listing
+# each one's ``(pattern, description)`` entries.
+_CATEGORY_ATTRS = (
+    ("front_matter", "FRONT_MATTER_PATTERNS"),
+    ("back_matter", "BACK_MATTER_PATTERNS"),
+    ("title_page", "TITLE_PAGE_PATTERNS"),
+    ("part_divider", "PART_DIVIDER_PATTERNS"),
+)
+
+
+def _title_category(classifier: type[ChapterClassifier], title_lower: str) -> str | None:
+    """Return the first pattern category matching *title_lower*, or None."""
+    patterns = tuple(
+        tuple(p for p, _ in getattr(classifier, attr)) for _, attr in _CATEGORY_ATTRS
+    )
+    return _patterns_category(patterns, title_lower)
+
+
+@lru_cache(maxsize=4096)
+def _patterns_category(patterns: tuple[tuple[str, ...], ...], title_lower: str) -> str | None:
+    """Return the first category whose *patterns* match *title_lower*, or None.
+
+    Titles repeat across TOC parsing and chapter extraction, so the answer is
+    memoized. The key holds the pattern strings themselves, so a pattern list
+    changed in any way, directly or through add_custom_pattern, is picked up.
+    """
+    for (category, _), category_patterns in zip(_CATEGORY_ATTRS, patterns):
+        if _matches_any(category_patterns, title_lower):
+            return category
+    return None
 
 
 @dataclass
@@ -109,36 +174,28 @@ class ChapterClassifier:
         if not title:
             return ChapterTags(is_chapter=False)
 
-        title_lower = title.lower().strip()
+        category = _title_category(cls, title.lower().strip())
         tags = ChapterTags()
 
-        # Check front matter
-        for pattern, _ in cls.FRONT_MATTER_PATTERNS:
-            if re.search(pattern, title_lower):
-                tags.is_front_matter = True
-                tags.is_chapter = False
-                return tags
-
-        # Check back matter
-        for pattern, _ in cls.BACK_MATTER_PATTERNS:
-            if re.search(pattern, title_lower):
-                tags.is_back_matter = True
-                tags.is_chapter = False
-                return tags
-
-        # Check title pages
-        for pattern, _ in cls.TITLE_PAGE_PATTERNS:
-            if re.search(pattern, title_lower):
-                tags.is_title_page = True
-                tags.is_chapter = False
-                return tags
-
-        # Check part/book/volume dividers
-        for pattern, _ in cls.PART_DIVIDER_PATTERNS:
-            if re.search(pattern, title_lower):
-                tags.is_part_divider = True
-                # Part dividers can also be chapters (for navigation)
-                return tags
+        if category == "front_matter":
+            tags.is_front_matter = True
+            tags.is_chapter = False
+            return tags
+
+        if category == "back_matter":
+            tags.is_back_matter = True
+            tags.is_chapter = False
+            return tags
+
+        if category == "title_page":
+            tags.is_title_page = True
+            tags.is_chapter = False
+            return tags
+
+        if category == "part_divider":
+            tags.is_part_divider = True
+            # Part dividers can also be chapters (for navigation)
+            return tags
 
         # Stub/navigation-only chapter: has a title but almost no content
         if word_count is not None and word_count < 30:
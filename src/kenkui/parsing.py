@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import logging
 import multiprocessing
+import os
 import re
 import shutil
 import subprocess
 import time
 import warnings
+from collections import Counter, deque
 from collections.abc import Callable
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from itertools import accumulate
+from operator import attrgetter
 from pathlib import Path
+from queue import Empty, SimpleQueue
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +26,225 @@ from .chapter_classifier import ChapterClassifier  # noqa: F401 – re-exported
 from .models import AudioResult, Chapter, ProcessingConfig, _normalize_bitrate
 from .readers import EbookReader, get_reader
 from .utils import extract_epub_cover
-from .workers import worker_process_chapter
+from .workers import init_worker, worker_process_chapter
+
+
+# ---------------------------------------------------------------------------
+# Worker progress queue
+# ---------------------------------------------------------------------------
+
+# Progress queue polling: block this long for the first message, then take at
+# most _QUEUE_DRAIN_MAX more without waiting before re-checking the futures.
+_QUEUE_POLL_S = 0.1
+_QUEUE_DRAIN_MAX = 256
+
+# Chapters queued in the process pool per worker; the rest wait in the parent.
+_IN_FLIGHT_PER_WORKER = 2
+
+# Worker errors printed in full at the end of a run; the rest are counted.
+_ERRORS_SHOWN = 10
+
+
+def _drain_queue(queue, timeout: float, limit: int) -> list[tuple]:
+    """Return up to *limit* queued messages, waiting *timeout* for the first."""
+    try:
+        messages = [queue.get(timeout=timeout)]
+    except Empty:
+        return []
+    while len(messages) < limit:
+        try:
+            messages.append(queue.get_nowait())
+        except Empty:
+            break
+    return messages
+
+
+# ---------------------------------------------------------------------------
+# ffmpeg concat helpers
+# ---------------------------------------------------------------------------
+
+# Above this many fragments, stitching merges groups of this size first.
+_STITCH_GROUP_SIZE = 256
+
+# One FFMETADATA chapter block: start ms, end ms, title.
+_CHAPTER_TEMPLATE = "[CHAPTER]\nTIMEBASE=1/1000\nSTART=%d\nEND=%d\ntitle=%s\n"
+
+
+def _concat_list(paths: list[Path]) -> str:
+    """Build an ffmpeg concat script for *paths*, to be fed on stdin.
+
+    Entries need an explicit file: URL (a bare path would resolve against
+    "pipe:"), and single quotes are escaped as the concat syntax requires.
+    Fragments share one or two directories, so each directory is resolved
+    once rather than every path.
+    """
+    resolved_dirs: dict[Path, str] = {}
+    lines = []
+    for p in paths:
+        base = resolved_dirs.get(p.parent)
+        if base is None:
+            base = resolved_dirs[p.parent] = p.parent.resolve().as_posix().rstrip("/")
+        path = f"{base}/{p.name}".replace("'", "'\\''")
+        lines.append(f"file 'file:{path}'\n")
+    return "".join(lines)
+
+
+def _concat_copy(paths: list[Path], output: Path) -> None:
+    """Concatenate *paths* into *output* without re-encoding."""
+    subprocess.run(
+        [
+            imageio_ffmpeg.get_ffmpeg_exe(),
+            "-y",
+            "-nostdin",
+            "-hide_banner",
+            "-nostats",
+            "-v", "error",
+            "-f", "concat",
+            "-safe", "0",
+            "-protocol_whitelist", "file,pipe",
+            "-i", "pipe:0",
+            "-c", "copy",
+            str(output),
+        ],
+        input=_concat_list(paths),
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        check=True,
+    )
+
+
+# RIFF sizes are 32-bit, so larger groups go through ffmpeg instead.
+_WAV_MAX_DATA = 0xFFFFFFFF - 36
+
+
+def _wav_layout(path: Path) -> tuple[bytes, int, int] | None:
+    """Return ``(fmt chunk, data offset, data size)`` for a PCM WAV file.
+
+    Returns None when *path* is not a plain RIFF/WAVE file.
+    """
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            return None
+        fmt = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, size = chunk[:4], int.from_bytes(chunk[4:], "little")
+            if chunk_id == b"fmt ":
+                fmt = f.read(size)
+            elif chunk_id == b"data":
+                return (fmt, f.tell(), size) if fmt else None
+            else:
+                f.seek(size, os.SEEK_CUR)
+            if size % 2:
+                f.seek(1, os.SEEK_CUR)
+
+
+def _copy_range(src: int, dst: int, offset: int, count: int) -> None:
+    """Copy *count* bytes at *offset* of fd *src* to the current end of *dst*."""
+    sendfile = getattr(os, "sendfile", None)
+    while count > 0:
+        if sendfile is not None:
+            try:
+                sent = sendfile(dst, src, offset, count)
+            except OSError:
+                # Some platforms only allow sockets as the destination.
+                sendfile = None
+                continue
+        else:
+            os.lseek(src, offset, os.SEEK_SET)
+            sent = os.write(dst, os.read(src, min(count, 1 << 20)))
+        if sent == 0:
+            raise OSError(f"Unexpected end of file while copying fd {src}")
+        offset += sent
+        count -= sent
+
+
+def _concat_wav(paths: list[Path], output: Path) -> bool:
+    """Concatenate same-format PCM WAV *paths* into *output* at the byte level.
+
+    The audio payloads are copied in the kernel with a single new header in
+    front, skipping ffmpeg's demux/remux loop. Returns False, writing
+    nothing, when the inputs do not share one format or would overflow a
+    RIFF header.
+    """
+    layouts = [_wav_layout(p) for p in paths]
+    if any(layout is None for layout in layouts):
+        return False
+    fmt = layouts[0][0]
+    if any(layout[0] != fmt for layout in layouts):
+        return False
+    total = sum(size for _, _, size in layouts)
+    if total > _WAV_MAX_DATA - len(fmt):
+        return False
+
+    header = b"".join(
+        [
+            b"RIFF",
+            (4 + 8 + len(fmt) + 8 + total).to_bytes(4, "little"),
+            b"WAVE",
+            b"fmt ",
+            len(fmt).to_bytes(4, "little"),
+            fmt,
+            b"data",
+            total.to_bytes(4, "little"),
+        ]
+    )
+    out_fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(out_fd, header)
+        for path, (_, offset, size) in zip(paths, layouts):
+            in_fd = os.open(path, os.O_RDONLY)
+            try:
+                _copy_range(in_fd, out_fd, offset, size)
+            finally:
+                os.close(in_fd)
+    finally:
+        os.close(out_fd)
+    return True
+
+
+def _merge_group(paths: list[Path], output: Path) -> Path:
+    """Merge *paths* into *output* (suffix chosen here), returning the file."""
+    wav = output.with_suffix(".wav")
+    if _concat_wav(paths, wav):
+        return wav
+    mka = output.with_suffix(".mka")
+    _concat_copy(paths, mka)
+    return mka
+
+
+# ---------------------------------------------------------------------------
+# Temp directory cleanup
+# ---------------------------------------------------------------------------
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove the directory tree at *path*.
+
+    The temp dir is a flat directory of fragments, so unlinking entries by
+    the type scandir already reported avoids a stat per file. Anything the
+    fast path cannot remove (read-only files on Windows, entries vanishing
+    underneath us) is retried with shutil.rmtree, which raises on failure.
+    """
+    if path.is_symlink():
+        shutil.rmtree(path)  # refuses symlinks, as before
+        return
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+        os.rmdir(path)
+    except OSError:
+        if os.path.lexists(path):
+            shutil.rmtree(path)
 
 
 # ---------------------------------------------------------------------------
@@ -76,7 +299,7 @@ def _load_annotated_chapters(cache_path: Path, included_indices: list[int]) -> l
         idx_set = set(included_indices)
         chapters = [ch for ch in chapters if ch.index in idx_set]
 
-    return sorted(chapters, key=lambda c: c.index)
+    return sorted(chapters, key=attrgetter("index"))
 
 
 # Suppress ALL warnings by default (verbose mode will re-enable them)
@@ -325,18 +548,20 @@ class AudioBuilder:
         total_batches: int,
         total_chars: int,
     ) -> list[AudioResult]:
-        results = []
+        # One slot per submitted chapter; chapters arrive in reading order,
+        # so filling slots by submission position keeps results ordered
+        # without a final sort.
+        results: list[AudioResult | None] = [None] * len(chapters)
         worker_state: dict = {}
         worker_errors: list[dict] = []
-        worker_logs: list[str] = []
+        worker_logs: deque[str] = deque(maxlen=20)
 
         eta_tracker = ETATracker(total_chars)
         chapter_start_times: dict[int, float] = {}
         completed_chapters = 0
         total_chapters = len(chapters)
 
-        manager = multiprocessing.Manager()
-        queue = manager.Queue()  # type: ignore
+        queue: multiprocessing.Queue = multiprocessing.Queue()
 
         cfg_dict: dict = {
             "voice": self.cfg.voice,
@@ -365,25 +590,45 @@ class AudioBuilder:
 
         pool: ProcessPoolExecutor | None = None
         try:
-            with ProcessPoolExecutor(max_workers=self.cfg.workers) as pool:
+            with ProcessPoolExecutor(
+                max_workers=self.cfg.workers,
+                initializer=init_worker,
+                initargs=(queue, cfg_dict),
+            ) as pool:
                 futures = {}
-                for idx, ch in enumerate(chapters):
-                    info = chapter_batch_info.get(ch.title, (0, 0, idx == 0))
-                    is_first = bool(info[2]) if len(info) > 2 else (idx == 0)
-                    fut = pool.submit(
-                        worker_process_chapter,
-                        ch,
-                        cfg_dict,
-                        self.temp_dir,
-                        queue,  # type: ignore
-                        is_first,
-                    )
-                    futures[fut] = ch
+                # Futures land here as they finish, so checking for
+                # completion is a queue read instead of a scan of every future.
+                finished: SimpleQueue = SimpleQueue()
+                done: list = []
+                # Chapters are submitted as earlier ones finish, keeping at
+                # most _IN_FLIGHT_PER_WORKER per worker queued in the pool
+                # instead of pickling the whole book into it up front.
+                pending = iter(enumerate(chapters))
+                in_flight_limit = _IN_FLIGHT_PER_WORKER * self.cfg.workers
 
                 while True:
-                    while not queue.empty():
+                    while len(futures) - len(done) < in_flight_limit:
+                        item = next(pending, None)
+                        if item is None:
+                            break
+                        idx, ch = item
+                        info = chapter_batch_info.get(ch.title, (0, 0, idx == 0))
+                        is_first = bool(info[2]) if len(info) > 2 else (idx == 0)
+                        fut = pool.submit(
+                            worker_process_chapter,
+                            ch,
+                            None,  # config and queue come from init_worker
+                            self.temp_dir,
+                            None,
+                            is_first,
+                        )
+                        fut.add_done_callback(finished.put)
+                        futures[fut] = idx
+
+                    messages = _drain_queue(queue, _QUEUE_POLL_S, _QUEUE_DRAIN_MAX)
+                    progressed = False
+                    for msg in messages:
                         try:
-                            msg = queue.get_nowait()
                             event, pid = msg[0], msg[1]
                             if event == "START":
                                 worker_state[pid] = {
@@ -401,8 +646,7 @@ class AudioBuilder:
                                 if pid in worker_state:
                                     worker_state[pid]["current"] += msg[2]
                                     self._current_chapter = worker_state[pid].get("title", "")
-                                eta_seconds = self._calculate_eta(eta_tracker)
-                                self._report_progress(self._current_chapter, eta_seconds)
+                                progressed = True
                             elif event == "DONE":
                                 if pid in worker_state:
                                     if pid in chapter_start_times:
@@ -423,18 +667,29 @@ class AudioBuilder:
                                 )
                             elif event == "LOG":
                                 worker_logs.append(f"[{pid}] {msg[2]}")
-                                if len(worker_logs) > 20:
-                                    worker_logs.pop(0)
                         except Exception:
-                            break
+                            continue
+
+                    # One progress report per drained batch, not per UPDATE.
+                    if progressed:
+                        eta_seconds = self._calculate_eta(eta_tracker)
+                        self._report_progress(self._current_chapter, eta_seconds)
 
-                    if all(f.done() for f in futures) and not worker_state and queue.empty():
+                    # An empty poll means the queue stayed idle for
+                    # _QUEUE_POLL_S, so late messages from finished workers
+                    # have been flushed.
+                    while True:
+                        try:
+                            done.append(finished.get_nowait())
+                        except Empty:
+                            break
+                    if not messages and not worker_state and len(done) == len(chapters):
                         break
 
-                for future in as_completed(futures):
+                for future in done:
                     res = future.result()
                     if res:
-                        results.append(res)
+                        results[futures[future]] = res
 
         except KeyboardInterrupt:
             print("Interrupted by user. Shutting down workers...")
@@ -443,49 +698,68 @@ class AudioBuilder:
             return []
         finally:
             if worker_errors:
-                print("Worker errors encountered:")
-                for err in worker_errors:
-                    print(f"- PID {err['pid']} {err['chapter']}: {err['message']}")
-                    if self.cfg.debug_html:
-                        print(err["traceback"])
+                self._report_worker_errors(worker_errors)
 
         # Suppress unused variable warning — total_chapters used in loop above
         _ = total_chapters
 
-        return sorted(results, key=lambda x: x.chapter_index)
+        return [res for res in results if res is not None]
+
+    def _report_worker_errors(self, worker_errors: list[dict]) -> None:
+        """Print the first few worker errors and summarize the rest by kind."""
+        print("Worker errors encountered:")
+        for err in worker_errors[:_ERRORS_SHOWN]:
+            print(f"- PID {err['pid']} {err['chapter']}: {err['message']}")
+            if self.cfg.debug_html:
+                print(err["traceback"])
+
+        hidden = worker_errors[_ERRORS_SHOWN:]
+        if not hidden:
+            return
+        for err in hidden:
+            logger.debug("Worker error in %s: %s", err["chapter"], err["message"])
+        kinds = Counter(err["message"].split(":", 1)[0] for err in hidden)
+        grouped = ", ".join(f"{kind} ×{count}" for kind, count in kinds.most_common(5))
+        print(f"... and {len(hidden)} more ({grouped})")
 
     def _stitch_files(
         self, results: list[AudioResult], output_file: Path, narrator_label: str = ""
     ):
-        file_list = self.temp_dir / "files.txt"
         meta_file = self.temp_dir / "metadata.txt"
 
-        with open(file_list, "w", encoding="utf-8") as f:
-            for res in results:
-                f.write(f"file '{res.file_path.resolve().as_posix()}'\n")
+        inputs = [res.file_path for res in results]
+        if len(inputs) > _STITCH_GROUP_SIZE:
+            inputs = self._merge_fragment_groups(inputs)
+        concat_list = _concat_list(inputs)
 
         total_ms = sum(r.duration_ms for r in results)
 
-        with open(meta_file, "w", encoding="utf-8") as f:
-            f.write(";FFMETADATA1\n")
-            if narrator_label:
-                f.write(f"comment=Narrated by {narrator_label}\n")
-            t = 0
-            for res in results:
-                start, end = int(t), int(t + res.duration_ms)
-                f.write(
-                    f"[CHAPTER]\nTIMEBASE=1/1000\nSTART={start}\nEND={end}\ntitle={res.title}\n"
-                )
-                t += res.duration_ms
+        # Durations are whole milliseconds (len() of an AudioSegment).
+        ends = list(accumulate(r.duration_ms for r in results))
+        starts = [0, *ends[:-1]]
+        meta = [";FFMETADATA1\n"]
+        if narrator_label:
+            meta.append(f"comment=Narrated by {narrator_label}\n")
+        meta.extend(
+            _CHAPTER_TEMPLATE % (start, end, res.title)
+            for res, start, end in zip(results, starts, ends)
+        )
+        meta_file.write_text("".join(meta), encoding="utf-8")
 
         cmd = [
             imageio_ffmpeg.get_ffmpeg_exe(),
             "-y",
+            # No keyboard interaction on stdin (it carries the concat list)
+            # and no banner; periodic stats only when debugging.
+            "-nostdin",
+            "-hide_banner",
+            "-stats" if self.cfg.verbose else "-nostats",
             "-v", "error",
             "-progress", "pipe:1",
             "-f", "concat",
             "-safe", "0",
-            "-i", str(file_list),
+            "-protocol_whitelist", "file,pipe",
+            "-i", "pipe:0",
             "-i", str(meta_file),
             "-map_metadata", "1",
             "-c:a", "aac" if output_file.suffix == ".m4b" else "libmp3lame",
@@ -497,8 +771,22 @@ class AudioBuilder:
         cmd.append(str(output_file))
 
         stitch_start = time.monotonic()
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        assert proc.stdout is not None
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        assert proc.stdin is not None and proc.stdout is not None
+        # ffmpeg reads the whole list before it starts encoding or reporting
+        # progress, so writing it up front cannot deadlock on stdout.
+        try:
+            proc.stdin.write(concat_list)
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its return code is checked below
 
         for line in proc.stdout:
             line = line.strip()
@@ -520,6 +808,24 @@ class AudioBuilder:
             stderr_out = proc.stderr.read() if proc.stderr else ""
             raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr_out)
 
+    def _merge_fragment_groups(self, fragments: list[Path]) -> list[Path]:
+        """Losslessly concatenate *fragments* in groups, in parallel.
+
+        WAV fragments are joined byte-for-byte; anything else goes through
+        ffmpeg's stream copy.
+
+        Returns the intermediate files in order, so the final encode pass
+        opens len(fragments) / _STITCH_GROUP_SIZE inputs instead of every
+        fragment.
+        """
+        groups = [
+            fragments[i : i + _STITCH_GROUP_SIZE]
+            for i in range(0, len(fragments), _STITCH_GROUP_SIZE)
+        ]
+        targets = [self.temp_dir / f"stitch_{n:03d}" for n in range(len(groups))]
+        with ThreadPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as ex:
+            return list(ex.map(_merge_group, groups, targets))
+
     def _embed_cover(self, output_file: Path) -> None:
         """Embed cover image from ebook into the M4B file."""
         try:
@@ -607,13 +913,13 @@ class AudioBuilder:
     @contextmanager
     def _managed_temp_dir(self):
         if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            _fast_rmtree(self.temp_dir)
         self.temp_dir.mkdir(parents=True)
         try:
             yield
         finally:
             if not self.cfg.keep_temp and self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
+                _fast_rmtree(self.temp_dir)
 
 
 __all__ = ["ETATracker", "AudioBuilder"]
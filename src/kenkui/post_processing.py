@@ -217,7 +217,9 @@ def _normalize_with_ffmpeg(output_path: Path, cfg: "PostProcessingConfig") -> No
     cmd = [
         ffmpeg,
         "-y",
+        "-nostdin",
         "-hide_banner",
+        "-nostats",
         "-v",
         "error",
         "-i",
@@ -232,7 +234,9 @@ def _normalize_with_ffmpeg(output_path: Path, cfg: "PostProcessingConfig") -> No
         "0",
         str(temp_out),
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(
+        cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True
+    )
     if result.returncode != 0:
         raise RuntimeError(f"ffmpeg loudnorm failed: {result.stderr}")
     temp_out.replace(output_path)
@@ -10,6 +10,7 @@ Architecture:
 - Implementations: EpubReader, MobiReader, etc.
 """
 
+import importlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,7 +18,7 @@ from pathlib import Path
 from ..models import Chapter
 
 
-@dataclass
+@dataclass(slots=True)
 class EbookMetadata:
     """Common metadata structure across all ebook formats."""
 
@@ -30,7 +31,7 @@ class EbookMetadata:
     cover_mime_type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TocEntry:
     """Represents a single entry in a table of contents."""
 
@@ -61,9 +62,33 @@ class EbookReader(ABC):
         self.filepath = filepath
         self.verbose = verbose
         self._metadata: EbookMetadata | None = None
+        self._toc: list[TocEntry] | None = None
 
-    @abstractmethod
     def get_metadata(self) -> EbookMetadata:
+        """Return the ebook metadata, extracting it on first use.
+
+        Returns:
+            EbookMetadata object with available metadata fields
+        """
+        if self._metadata is None:
+            self._metadata = self._load_metadata()
+        return self._metadata
+
+    def get_toc(self) -> list[TocEntry]:
+        """Return the table of contents, extracting it on first use.
+
+        The list is cached on the reader and shared between callers, so it
+        must not be mutated.
+
+        Returns:
+            List of TocEntry objects representing the TOC structure
+        """
+        if self._toc is None:
+            self._toc = self._load_toc()
+        return self._toc
+
+    @abstractmethod
+    def _load_metadata(self) -> EbookMetadata:
         """Extract metadata from the ebook.
 
         Returns:
@@ -72,7 +97,7 @@ class EbookReader(ABC):
         pass
 
     @abstractmethod
-    def get_toc(self) -> list[TocEntry]:
+    def _load_toc(self) -> list[TocEntry]:
         """Extract the table of contents.
 
         Returns:
@@ -115,8 +140,7 @@ class EbookReader(ABC):
         Returns:
             Number of chapters in the ebook
         """
-        toc = self.get_toc()
-        return len(toc)
+        return len(self.get_toc())
 
     @property
     def extension(self) -> str:
@@ -138,6 +162,20 @@ class Registry:
 
     _readers: dict[str, type[EbookReader]] = {}
 
+    # Extension -> implementation module. Modules are imported on first
+    # lookup so that opening an .epub does not pay for the MOBI/FB2 backends;
+    # importing a module registers its reader via the decorator. Keys must
+    # match each reader's SUPPORTED_EXTENSIONS.
+    _modules: dict[str, str] = {
+        ".epub": ".epub",
+        ".fb2": ".fb2",
+        ".fb2.zip": ".fb2",
+        ".mobi": ".mobi",
+        ".azw": ".mobi",
+        ".azw3": ".mobi",
+        ".azw4": ".mobi",
+    }
+
     @classmethod
     def register(cls, reader_class: type[EbookReader]) -> type[EbookReader]:
         """Register a reader class for its supported extensions.
@@ -162,9 +200,30 @@ class Registry:
         Returns:
             Reader class or None if no reader found for extension
         """
-        ext = filepath.suffix.lower()
+        ext = filepath.suffix
+        # Keys are stored lowercase, so the common case needs no .lower().
+        reader_class = cls._readers.get(ext)
+        if reader_class is not None:
+            return reader_class
+        ext = cls._extension(filepath)
+        if ext not in cls._readers and ext in cls._modules:
+            importlib.import_module(cls._modules[ext], __name__)
         return cls._readers.get(ext)
 
+    @classmethod
+    def _extension(cls, filepath: Path) -> str:
+        """Return the lowercased extension of *filepath*.
+
+        A double extension such as ``.fb2.zip`` is returned whole when a
+        reader handles it, since ``Path.suffix`` only sees ``.zip``.
+        """
+        suffixes = filepath.suffixes
+        if len(suffixes) > 1:
+            double = "".join(suffixes[-2:]).lower()
+            if double in cls._modules:
+                return double
+        return filepath.suffix.lower()
+
     @classmethod
     def create_reader(cls, filepath: Path, verbose: bool = False) -> EbookReader:
         """Create a reader instance for the given file.
@@ -181,7 +240,7 @@ class Registry:
         """
         reader_class = cls.get_reader_class(filepath)
         if reader_class is None:
-            supported = ", ".join(sorted(cls._readers.keys()))
+            supported = ", ".join(sorted(cls.supported_extensions()))
             raise ValueError(
                 f"No reader available for '{filepath.suffix}' files. "
                 f"Supported formats: {supported}"
@@ -191,12 +250,18 @@ class Registry:
     @classmethod
     def supported_extensions(cls) -> set[str]:
         """Return all supported file extensions."""
-        return set(cls._readers.keys())
+        return set(cls._readers) | set(cls._modules)
 
     @classmethod
     def is_supported(cls, filepath: Path) -> bool:
         """Check if a file format is supported."""
-        return filepath.suffix.lower() in cls._readers
+        ext = cls._extension(filepath)
+        return ext in cls._readers or ext in cls._modules
+
+
+def _joined_length(paragraphs: list[str]) -> int:
+    """Return ``len(" ".join(paragraphs))`` without building the string."""
+    return sum(map(len, paragraphs)) + max(len(paragraphs) - 1, 0)
 
 
 def get_reader(filepath: Path, verbose: bool = False) -> EbookReader:
@@ -214,13 +279,17 @@ def get_reader(filepath: Path, verbose: bool = False) -> EbookReader:
     return Registry.create_reader(filepath, verbose)
 
 
-# Import implementations to register them with the Registry
-# These must appear after class definitions to avoid circular references.
-from . import (
-    epub,  # noqa: E402
-    fb2,  # noqa: E402
-    mobi,  # noqa: E402
-)
+_SUBMODULES = frozenset({"epub", "mobi", "fb2"})
+
+
+def __getattr__(name: str):
+    # Implementations are imported lazily (see Registry._modules), so bs4 is
+    # only loaded by the MOBI reader; keep ``readers.epub`` style attribute
+    # access working for callers.
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "EbookReader",
@@ -1,106 +1,382 @@
 """
 EPUB ebook reader implementation.
 
-Provides EbookReader interface for EPUB files using ebooklib.
+Provides EbookReader interface for EPUB files, reading the OPF package and
+content documents directly from the ZIP archive.
 """
 
 from __future__ import annotations
 
+import io
+import posixpath
 import re
 import warnings
 import zipfile
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from operator import itemgetter
 from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
 
-from bs4 import BeautifulSoup
-from ebooklib import epub
+from lxml import etree as ET
+from lxml import html as LH
 
 from ..chapter_classifier import ChapterClassifier
 from ..models import Chapter
-from ..utils import extract_epub_cover
-from . import EbookMetadata, EbookReader, Registry, TocEntry
+from ..utils import extract_epub_cover_from_zip
+from . import (
+    EbookMetadata,
+    EbookReader,
+    Registry,
+    TocEntry,
+    _joined_length,
+)
+
+# Patterns used in the per-element extraction loops, compiled once.
+_SANITIZE_RE = re.compile(r'[\\/*?:"<>|]')
+_SURROGATE_RE = re.compile("[\ud800-\udfff]")
+# Charset named by an XML declaration or a <meta> tag near the top of an item.
+_CHARSET_RE = re.compile(rb"""encoding=["']([\w.:-]+)|charset=["']?([\w.:-]+)""", re.I)
+_CLEAN_CLASS_RE = re.compile(r"page-?number|hidden|metadata|footnote", re.I)
+# Volume/part and book headers share one scan; ``lastgroup`` says which hit.
+_DIVISION_HEADER_RE = re.compile(
+    r"^(?:(?P<volume>(?:volume|part)\s+[ivxlcdm\d]+)"
+    r"|(?P<book>book\s+(?:the\s+)?(?:[ivxlcdm\d]+|[a-z]+)))",
+    re.I,
+)
+_CHAPTER_HEADER_RE = re.compile(
+    r"^(chapter\s+[ivxlcdm\d]+|(?=[IVXLCDM]+\.)[IVXLCDM]+)([\.\-\—\s:]+)(.*)$", re.I
+)
+# Every first character the two header patterns can match; re.I also lets
+# the dotted and dotless I stand in for "i".
+_HEADER_INITIALS = frozenset("bcdilmpvxBCDILMPVX\u0130\u0131")
+_SENTENCE_END_RE = re.compile(r"(?<=\.)\s+")
+_DIALOGUE_SPLIT_RE = re.compile(r"\|\s*([A-Z][A-Z\s]+):\s*")
+
+_STRIP_TAGS = frozenset({"sup", "script", "style", "nav", "footer"})
+_BLOCK_TAGS = frozenset({"p", "div"})
+_ITALIC_TAGS = frozenset({"em", "i"})
+_FALLBACK_TAGS = frozenset({"h1", "h2", "h3", "h4", "p", "div", "section"})
+_FALLBACK_CONTAINERS = frozenset({"p", "h1", "h2", "h3", "h4", "section"})
+# Tags whose text is not read as content: ruby annotations, templates and
+# code.
+_NON_CONTENT_TAGS = frozenset({"rt", "rp", "template", "script", "style"})
+# Strings made only of these collapse to one space or newline, except inside
+# the whitespace-preserving tags.
+_ASCII_SPACES = " \n\t\f\r"
+_PRESERVE_SPACE_TAGS = ("pre", "textarea")
+
+# XML namespaces, prefix maps and qualified tag names used to locate and read
+# the TOC.
+_OPF_URI = "http://www.idpf.org/2007/opf"
+_DC_URI = "http://purl.org/dc/elements/1.1/"
+_NCX_URI = "http://www.daisy.org/z3986/2005/ncx/"
+_CONTAINER_PATH = "META-INF/container.xml"
+_CONTAINER_NS = {"container": "urn:oasis:names:tc:opendocument:xmlns:container"}
+_NCX_NS = {"ncx": _NCX_URI}
+_XHTML_NS = {"xhtml": "http://www.w3.org/1999/xhtml"}
+_OPF_ITEM_TAG = f"{{{_OPF_URI}}}item"
+_OPF_ITEMREF_TAG = f"{{{_OPF_URI}}}itemref"
+_DC_PREFIX = f"{{{_DC_URI}}}"
+_NCX_NAVMAP_TAG = f"{{{_NCX_URI}}}navMap"
+_XHTML_PREFIX = "{http://www.w3.org/1999/xhtml}"
+_XHTML_NAV_TAG = f"{_XHTML_PREFIX}nav"
+_NCX_NAVPOINT_TAG = f"{{{_NCX_URI}}}navPoint"
+_NCX_MEDIA_TYPE = "application/x-dtbncx+xml"
+_DOCUMENT_MEDIA_TYPES = frozenset({"application/xhtml+xml", "text/html"})
+_DOCUMENT_SUFFIXES = (".xhtml", ".html", ".htm", ".xml")
+
+# Below this much chapter HTML a process pool costs more than it saves: the
+# workers' start-up (a fresh interpreter per worker under spawn) dominates.
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+
+@dataclass
+class _ManifestItem:
+    """One ``<item>`` of the OPF manifest."""
+
+    id: str | None
+    href: str | None
+    media_type: str | None
+    properties: str | None
+
+    @property
+    def name(self) -> str | None:
+        """Item name as used in TOC hrefs (the unquoted manifest href)."""
+        return unquote(self.href) if self.href is not None else None
+
+    @property
+    def is_document(self) -> bool:
+        """True if the item is (X)HTML text rather than CSS, images or fonts."""
+        if self.media_type:
+            return self.media_type.split(";", 1)[0].strip() in _DOCUMENT_MEDIA_TYPES
+        return self.href is not None and self.href.lower().endswith(_DOCUMENT_SUFFIXES)
+
+
+@dataclass
+class _Package:
+    """The parts of the OPF package document the reader needs."""
+
+    opf_dir: str
+    manifest: list[_ManifestItem] = field(default_factory=list)
+    spine: list[str] = field(default_factory=list)
+    # Dublin Core element values in document order, keyed by local name.
+    dc: dict[str, list[str | None]] = field(default_factory=dict)
+
+
+def _normalize_href(href: str) -> str:
+    """Collapse ``./`` and ``..`` segments so equivalent hrefs compare equal."""
+    return posixpath.normpath(href) if href else href
+
+
+def _repeats_title(title: str, paragraph: str) -> bool:
+    """Return True if *title* ends with *paragraph*, ignoring case.
+
+    Case is compared with ``casefold()``, so "STRASSE" repeats "Straße".
+    Case folding at most triples a string's length, so a paragraph more
+    than three times as long as the title cannot match; that rules out
+    ordinary body text without folding it.
+    """
+    if len(paragraph) > 3 * len(title):
+        return False
+    return title.casefold().endswith(paragraph.casefold())
+
+
+class _LxmlRun:
+    """A run of sibling lxml elements read as one document.
+
+    A whole document is the run of its root element; a chapter that shares
+    its file with others is the run of elements between two anchors, read in
+    place without re-parenting them.
+    """
+
+    __slots__ = ("contents",)
+
+    def __init__(self, nodes: list):
+        self.contents = nodes
+
+    def find(self, name: str):
+        for node in self.contents:
+            for found in node.iter(name):
+                return found
+        return None
+
+    def get_text(self, separator: str = "") -> str:
+        return separator.join(s for node in self.contents for s in _lxml_strings(node))
+
+
+def _utf8_document(content: bytes) -> bytes:
+    """Return *content* as UTF-8, re-encoding items in any other encoding.
+
+    EPUB content documents are UTF-8 or UTF-16; UTF-16 is recognised by its
+    byte order mark. Anything else is decoded with the charset it declares,
+    or as Windows-1252 when it declares none.
+    """
+    if content.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return content.decode("utf-16", "replace").encode("utf-8")
+    try:
+        content.decode("utf-8")
+        return content
+    except UnicodeDecodeError:
+        pass
+    match = _CHARSET_RE.search(content, 0, 1024)
+    charset = (match.group(1) or match.group(2)).decode("ascii") if match else "cp1252"
+    try:
+        return content.decode(charset, "replace").encode("utf-8")
+    except LookupError:
+        return content.decode("cp1252", "replace").encode("utf-8")
+
+
+def _lxml_document(content: bytes) -> _LxmlRun:
+    """Parse (X)HTML *content* with lxml and strip the noise elements.
+
+    A document lxml cannot read at all (an empty one, say) is an empty run.
+    """
+    try:
+        root = LH.document_fromstring(
+            _utf8_document(content), parser=LH.HTMLParser(encoding="utf-8")
+        )
+    except ET.LxmlError:
+        return _LxmlRun([])
+    _clean_tree(root)
+    return _LxmlRun([root])
+
+
+def _clean_tree(root) -> None:
+    """Normalize whitespace and remove noise elements from a parsed tree.
+
+    Whitespace-only strings outside ``<pre>``/``<textarea>`` collapse to a
+    single newline or space. Each element in ``_STRIP_TAGS`` or with a
+    noise class is swapped for an empty comment holding its tail, so the
+    text on either side stays two strings.
+    """
+    preserved = {el for zone in root.iter(*_PRESERVE_SPACE_TAGS) for el in zone.iter()}
+    noise = []
+    for el in root.iter():
+        text = el.text
+        if text and not text.strip(_ASCII_SPACES) and el not in preserved:
+            el.text = "\n" if "\n" in text else " "
+        tail = el.tail
+        if tail and not tail.strip(_ASCII_SPACES) and el.getparent() not in preserved:
+            el.tail = "\n" if "\n" in tail else " "
+        if isinstance(el.tag, str) and (
+            el.tag in _STRIP_TAGS or _CLEAN_CLASS_RE.search(el.get("class", ""))
+        ):
+            noise.append(el)
+    for el in noise:
+        parent = el.getparent()
+        if parent is not None:
+            placeholder = ET.Comment()
+            placeholder.tail = el.tail
+            parent.replace(el, placeholder)
+
+
+def _lxml_contents(elem) -> list:
+    """*elem*'s children interleaved with its text and tails, in document order."""
+    contents = [elem.text] if elem.text else []
+    for child in elem:
+        contents.append(child)
+        if child.tail:
+            contents.append(child.tail)
+    return contents
+
+
+def _lxml_strings(elem) -> Iterator[str]:
+    """Yield the text strings of *elem*, leaving out ``_NON_CONTENT_TAGS``."""
+    if elem.tag in _NON_CONTENT_TAGS:
+        return
+    if next(elem.iter(*_NON_CONTENT_TAGS), None) is None:
+        # Nothing to skip: itertext() already leaves out comments.
+        yield from elem.itertext()
+        return
+    stack = _lxml_contents(elem)
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            yield node
+        elif isinstance(node.tag, str) and node.tag not in _NON_CONTENT_TAGS:
+            stack.extend(reversed(_lxml_contents(node)))
+
+
+def _lxml_marked_text(elem) -> str:
+    """Text of *elem* with italic runs wrapped in \\x02/\\x03 markers."""
+    parts: list[str] = []
+    stack = _lxml_contents(elem)
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            parts.append(node)
+        elif not isinstance(node.tag, str):
+            # Comment text counts as a string too.
+            if node.text:
+                parts.append(node.text)
+        elif node.tag in _ITALIC_TAGS:
+            inner = "".join(_lxml_strings(node)).strip()
+            if inner:
+                parts.append(f"\x02{inner}\x03")
+        else:
+            stack.extend(reversed(_lxml_contents(node)))
+    return " ".join(parts)
+
+
+def _lxml_blocks(nodes: list, names: frozenset[str], containers: frozenset[str]):
+    """Yield elements named in *names* under *nodes*, in document order.
+
+    Elements named in *containers* are yielded but not descended into.
+    """
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if not isinstance(node.tag, str):
+            continue
+        if node.tag in names:
+            yield node
+        if node.tag not in containers:
+            stack.extend(reversed(node))
+
+
+def _child_tags(elem) -> list:
+    """Element children of *elem*, in order."""
+    return [child for child in elem if isinstance(child.tag, str)]
+
+
+def _get_text(elem, separator: str = "") -> str:
+    """Text of *elem*, its strings joined with *separator*."""
+    return separator.join(_lxml_strings(elem))
+
+
+def _iter_tags(doc: _LxmlRun) -> Iterator:
+    """Every element of *doc* in document order."""
+    return (el for node in doc.contents for el in node.iter() if isinstance(el.tag, str))
+
+
+def _next_tag(node):
+    """The next sibling element of *node*, skipping comments."""
+    node = node.getnext()
+    while node is not None and not isinstance(node.tag, str):
+        node = node.getnext()
+    return node
 
 
 @Registry.register
 class EpubReader(EbookReader):
-    """EPUB ebook reader using ebooklib."""
+    """EPUB ebook reader."""
 
     SUPPORTED_EXTENSIONS = {".epub"}
+    # Worker processes used to parse chapter HTML. Parsing is serial unless
+    # this is raised above 1, and even then only for very large books.
+    PARSE_WORKERS: int = 1
 
     def __init__(self, filepath: Path, verbose: bool = False):
         super().__init__(filepath, verbose)
-        with warnings.catch_warnings(record=True):
-            warnings.simplefilter("always")
-            self.book = epub.read_epub(str(filepath))
+        self._zip = zipfile.ZipFile(str(filepath), "r")
+        self._names = set(self._zip.namelist())
+        self._toc_chapters: list[dict] | None = None
+        if self._package is None:
+            self._zip.close()
+            raise ValueError(f"Not a valid EPUB (no OPF package found): {filepath}")
 
-    def get_metadata(self) -> EbookMetadata:
-        """Extract metadata from EPUB."""
-        title = self._get_title()
-        author = self._get_author()
-        language = self._get_language()
-        publisher = self._get_publisher()
-        description = self._get_description()
+    def close(self) -> None:
+        """Release the underlying ZIP file handle."""
+        self._zip.close()
 
-        cover_data, cover_mime = extract_epub_cover(self.filepath)
+    def __enter__(self) -> EpubReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _load_metadata(self) -> EbookMetadata:
+        """Extract metadata from EPUB."""
+        dc = self._dc_value
+        title = dc("title")
+        cover_data, cover_mime = self._cover
 
         return EbookMetadata(
-            title=title,
-            author=author,
-            language=language,
-            publisher=publisher,
-            description=description,
+            title=self._sanitize_filename(title) if title is not None else self.filepath.stem,
+            author=dc("creator"),
+            language=dc("language"),
+            publisher=dc("publisher"),
+            description=dc("description"),
             cover_image=cover_data,
             cover_mime_type=cover_mime,
         )
 
-    def _get_title(self) -> str:
-        try:
-            metadata = self.book.get_metadata("DC", "title")
-            if metadata:
-                return self._sanitize_filename(metadata[0][0])
-        except Exception:
-            pass
-        return self.filepath.stem
-
-    def _get_author(self) -> str | None:
-        try:
-            metadata = self.book.get_metadata("DC", "creator")
-            if metadata:
-                return metadata[0][0]
-        except Exception:
-            pass
-        return None
-
-    def _get_language(self) -> str | None:
-        try:
-            metadata = self.book.get_metadata("DC", "language")
-            if metadata:
-                return metadata[0][0]
-        except Exception:
-            pass
-        return None
-
-    def _get_publisher(self) -> str | None:
-        try:
-            metadata = self.book.get_metadata("DC", "publisher")
-            if metadata:
-                return metadata[0][0]
-        except Exception:
-            pass
-        return None
-
-    def _get_description(self) -> str | None:
-        try:
-            metadata = self.book.get_metadata("DC", "description")
-            if metadata:
-                return metadata[0][0]
-        except Exception:
-            pass
-        return None
+    def _dc_value(self, name: str) -> str | None:
+        """Return the first ``dc:<name>`` value from the OPF metadata."""
+        values = self._package.dc.get(name)
+        return values[0] if values else None
 
     def _sanitize_filename(self, name: str) -> str:
-        return re.sub(r'[\\/*?:"<>|]', "", name).strip()
+        return _SANITIZE_RE.sub("", name).strip()
 
-    def get_toc(self) -> list[TocEntry]:
+    def _load_toc(self) -> list[TocEntry]:
         """Extract table of contents from EPUB."""
         toc_chapters = self._parse_toc_structure()
         return [
@@ -111,162 +387,235 @@ class EpubReader(EbookReader):
         ]
 
     def _parse_toc_structure(self) -> list[dict]:
-        """Parse the EPUB TOC (NCX or NAV) into a structured list."""
-        from xml.etree import ElementTree as ET
+        """Return the parsed TOC, reading it from the archive on first use.
 
+        The list is shared between callers and must not be mutated.
+        """
+        if self._toc_chapters is None:
+            self._toc_chapters = self._read_toc_structure()
+        return self._toc_chapters
+
+    def _read_toc_structure(self) -> list[dict]:
+        """Parse the EPUB TOC (NCX or NAV) into a structured list."""
         chapters: list[dict] = []
 
-        toc_file, toc_type = self._find_toc_file()
-        if toc_file is None:
+        toc_file, toc_type = self._toc_file
+        toc_xml = self._toc_bytes
+        if toc_xml is None:
             return chapters
 
         try:
-            with zipfile.ZipFile(str(self.filepath), "r") as epub_zip:
-                toc_content = epub_zip.read(toc_file).decode("utf-8")
-                toc_tree = ET.fromstring(toc_content)
-
-                if toc_type == "ncx":
-                    ns = {"ncx": "http://www.daisy.org/z3986/2005/ncx/"}
-                    for navpoint in toc_tree.findall(".//ncx:navPoint", ns):
-                        navlabel = navpoint.find("ncx:navLabel/ncx:text", ns)
-                        title = navlabel.text if navlabel is not None else "Untitled"
-
-                        content = navpoint.find("ncx:content", ns)
-                        if content is not None:
-                            src = content.get("src", "")
-                            href = src.split("#")[0]
-
-                            # Determine level from navPoint depth
-                            level = 0
-                            depth_attr = navpoint.get("depth")
-                            if depth_attr:
-                                try:
-                                    level = int(depth_attr)
-                                except (ValueError, TypeError):
-                                    pass
-
-                            chapters.append(
-                                {
-                                    "title": title,
-                                    "href": href,
-                                    "src": src,
-                                    "level": level,
-                                }
-                            )
-                else:
-                    # EPUB3 NAV format
-                    ns = {"xhtml": "http://www.w3.org/1999/xhtml"}
-                    toc_nav = toc_tree.find(".//xhtml:nav[@epub:type='toc']", ns)
-                    if toc_nav is None:
-                        toc_nav = toc_tree.find(".//nav[@epub:type='toc']")
-
-                    if toc_nav is not None:
-                        # Build hierarchical levels from nested lists
-                        self._parse_nav_recursive(toc_nav, chapters, level=0)
+            if toc_type == "ncx":
+                chapters.extend(self._stream_ncx(toc_xml))
+            else:
+                # EPUB3 NAV format. Settle the namespace once from the root
+                # rather than trying every lookup with and without it.
+                toc_tree = ET.fromstring(toc_xml)
+                ns = _XHTML_PREFIX if toc_tree.tag.startswith(_XHTML_PREFIX) else ""
+                toc_nav = next(
+                    (n for n in toc_tree.iter(f"{ns}nav") if "toc" in n.attrib.values()),
+                    None,
+                )
+                toc_list = toc_nav.find(f".//{ns}ol") if toc_nav is not None else None
+                if toc_list is not None:
+                    # Build hierarchical levels from nested lists
+                    self._parse_nav_recursive(toc_list, chapters, 0, ns)
+                # NAV hrefs are relative to the NAV document; manifest names
+                # are relative to the OPF.
+                base = posixpath.dirname(posixpath.relpath(toc_file, self._package.opf_dir or "."))
+                if base:
+                    for ch in chapters:
+                        ch["src"] = posixpath.normpath(posixpath.join(base, ch["src"]))
+                        ch["href"] = ch["src"].split("#")[0]
 
         except Exception:
             pass
 
         return chapters
 
-    def _parse_nav_recursive(self, element, chapters: list[dict], level: int):
-        """Parse NAV element recursively to extract TOC with levels."""
-
-        ns = {"xhtml": "http://www.w3.org/1999/xhtml"}
-
-        # Find direct child ol elements (nested lists)
-        ol_elements = element.findall(".//xhtml:ol", ns)
-        if not ol_elements:
-            ol_elements = element.findall(".//ol")
-
-        for ol in ol_elements:
-            for li in (
-                ol.findall(".//xhtml:li", ns)
-                if ns.get("xhtml")
-                else ol.findall(".//li")
-            ):
-                # Find anchor in this li
-                link = li.find(".//xhtml:a", ns) if ns.get("xhtml") else li.find(".//a")
-                if link is not None:
-                    title = link.text or "Untitled"
-                    src = link.get("href", "")
-                    href = src.split("#")[0] if src else ""
-
-                    if href:
-                        chapters.append(
-                            {
-                                "title": title,
-                                "href": href,
-                                "src": src,
-                                "level": level,
-                            }
-                        )
-
-                # Recurse into nested ol
-                nested_ol = (
-                    li.find(".//xhtml:ol", ns) if ns.get("xhtml") else li.find(".//ol")
-                )
-                if nested_ol is not None:
-                    self._parse_nav_recursive(nested_ol, chapters, level + 1)
-
-    def _find_toc_file(self) -> tuple[str | None, str | None]:
-        """Find the TOC file (NCX or NAV) in the EPUB."""
-        from xml.etree import ElementTree as ET
-
-        with zipfile.ZipFile(str(self.filepath), "r") as epub_zip:
-            namelist = epub_zip.namelist()
-
-            container_path = "META-INF/container.xml"
-            if container_path in namelist:
-                container_xml = epub_zip.read(container_path)
-                container_tree = ET.fromstring(container_xml)
+    @staticmethod
+    def _stream_ncx(ncx_xml: bytes) -> list[dict]:
+        """Collect NCX navPoints in document order without keeping the tree.
 
-                ns = {"container": "urn:oasis:names:tc:opendocument:xmlns:container"}
-                rootfile = container_tree.find(".//container:rootfile", ns)
-                if rootfile is not None:
-                    opf_path = rootfile.get("full-path")
-                    if opf_path is None:
-                        return (None, None)
+        Each navPoint is read when it closes and then cleared; a slot is
+        reserved when it opens so nested points keep their preorder position.
+        """
+        entries: list[dict | None] = []
+        open_slots: list[int] = []
 
-                    opf_xml = epub_zip.read(opf_path)
-                    opf_tree = ET.fromstring(opf_xml)
+        for event, navpoint in ET.iterparse(
+            io.BytesIO(ncx_xml), events=("start", "end")
+        ):
+            if navpoint.tag != _NCX_NAVPOINT_TAG:
+                continue
+            if event == "start":
+                open_slots.append(len(entries))
+                entries.append(None)
+                continue
 
-                    opf_ns = {"opf": "http://www.idpf.org/2007/opf"}
+            slot = open_slots.pop()
+            navlabel = navpoint.find("ncx:navLabel/ncx:text", _NCX_NS)
+            title = navlabel.text if navlabel is not None else "Untitled"
+
+            content = navpoint.find("ncx:content", _NCX_NS)
+            if content is not None:
+                src = content.get("src", "")
+                href = src.split("#")[0]
+
+                # Determine level from navPoint depth
+                level = 0
+                depth_attr = navpoint.get("depth")
+                if depth_attr:
+                    try:
+                        level = int(depth_attr)
+                    except (ValueError, TypeError):
+                        pass
+
+                entries[slot] = {
+                    "title": title,
+                    "href": href,
+                    "src": src,
+                    "level": level,
+                }
+            navpoint.clear()
+
+        return [entry for entry in entries if entry is not None]
+
+    def _parse_nav_recursive(self, toc_list, chapters: list[dict], level: int, ns: str):
+        """Append the entries of a NAV ``<ol>`` and, one level down, its sublists.
+
+        *ns* is the ``{uri}`` prefix of the document's tags, or "" when the
+        NAV is not namespaced.
+        """
+        for li in toc_list.iterfind(f"{ns}li"):
+            link = li.find(f"{ns}a")
+            if link is not None:
+                title = "".join(link.itertext()).strip() or "Untitled"
+                src = link.get("href", "")
+                href = src.split("#")[0] if src else ""
+
+                if href:
+                    chapters.append(
+                        {
+                            "title": title,
+                            "href": href,
+                            "src": src,
+                            "level": level,
+                        }
+                    )
 
-                    # Look for NCX
-                    ncx_item = opf_tree.find(
-                        ".//opf:item[@media-type='application/x-dtbncx+xml']", opf_ns
+            # Recurse into nested ol
+            nested_ol = li.find(f"{ns}ol")
+            if nested_ol is not None:
+                self._parse_nav_recursive(nested_ol, chapters, level + 1, ns)
+
+    @cached_property
+    def _package(self) -> _Package | None:
+        """Read container.xml and stream the OPF manifest and spine, once."""
+        if _CONTAINER_PATH not in self._names:
+            return None
+        container_tree = ET.fromstring(self._zip.read(_CONTAINER_PATH))
+        rootfile = container_tree.find(".//container:rootfile", _CONTAINER_NS)
+        opf_path = rootfile.get("full-path") if rootfile is not None else None
+        if opf_path is None:
+            return None
+
+        package = _Package(opf_dir=posixpath.dirname(opf_path))
+        # Parse straight from the zip stream rather than a full copy.
+        with self._zip.open(opf_path) as opf:
+            for _, elem in ET.iterparse(opf):
+                if elem.tag == _OPF_ITEM_TAG:
+                    package.manifest.append(
+                        _ManifestItem(
+                            id=elem.get("id"),
+                            href=elem.get("href"),
+                            media_type=elem.get("media-type"),
+                            properties=elem.get("properties"),
+                        )
                     )
-                    if ncx_item is not None:
-                        ncx_href = ncx_item.get("href")
-                        if ncx_href is not None:
-                            opf_dir = str(Path(opf_path).parent)
-                            ncx_path = (
-                                ncx_href
-                                if opf_dir == "."
-                                else str(Path(opf_dir) / ncx_href)
-                            )
-                            return (ncx_path, "ncx")
-
-                    # Look for NAV (EPUB3)
-                    nav_item = opf_tree.find(".//opf:item[@properties='nav']", opf_ns)
-                    if nav_item is not None:
-                        nav_href = nav_item.get("href")
-                        if nav_href is not None:
-                            opf_dir = str(Path(opf_path).parent)
-                            nav_path = (
-                                nav_href
-                                if opf_dir == "."
-                                else str(Path(opf_dir) / nav_href)
-                            )
-                            return (nav_path, "nav")
-
-            # Fallback: search for common TOC file names
-            for name in namelist:
-                if name.endswith(".ncx"):
-                    return (name, "ncx")
-                if "nav.xhtml" in name.lower() or "toc.xhtml" in name.lower():
-                    return (name, "nav")
+                    elem.clear()
+                elif elem.tag == _OPF_ITEMREF_TAG:
+                    package.spine.append(elem.get("idref"))
+                    elem.clear()
+                elif isinstance(elem.tag, str) and elem.tag.startswith(_DC_PREFIX):
+                    name = elem.tag[len(_DC_PREFIX) :]
+                    package.dc.setdefault(name, []).append(elem.text)
+        return package
+
+    def _read_item(self, name: str) -> bytes | None:
+        """Return the bytes of manifest item *name*, or None if it is missing."""
+        package = self._package
+        if package is None:
+            return None
+        try:
+            return self._zip.read(posixpath.join(package.opf_dir, name))
+        except KeyError:
+            return None
+
+    def _iter_manifest_items(self) -> Iterator[tuple[str, bytes]]:
+        """Yield ``(name, content)`` for every manifest item, in manifest order."""
+        package = self._package
+        if package is None:
+            return
+        for item in package.manifest:
+            name = item.name
+            content = self._read_item(name) if name is not None else None
+            if content is not None:
+                yield name, content
+
+    def _iter_spine_items(self) -> Iterator[tuple[str, bytes]]:
+        """Yield ``(name, content)`` for each spine document, in reading order."""
+        package = self._package
+        if package is None:
+            return
+        by_id = {item.id: item for item in package.manifest}
+        seen: set[str] = set()
+        for idref in package.spine:
+            item = by_id.get(idref)
+            if item is None or not item.is_document:
+                continue
+            name = item.name
+            if name is None or name in seen:
+                continue
+            seen.add(name)
+            content = self._read_item(name)
+            if content is not None:
+                yield name, content
+
+    @cached_property
+    def _toc_bytes(self) -> bytes | None:
+        """Raw TOC document, read once and shared by the TOC parsers."""
+        toc_file, _ = self._toc_file
+        if toc_file is None or toc_file not in self._names:
+            return None
+        return self._zip.read(toc_file)
+
+    @cached_property
+    def _toc_file(self) -> tuple[str | None, str | None]:
+        """Find the TOC file (NCX or NAV) in the EPUB."""
+        package = self._package
+        if package is not None:
+            # Prefer the NCX; fall back to the first EPUB3 NAV item. One pass
+            # over the manifest finds both.
+            nav_href = None
+            for item in package.manifest:
+                if item.href is None:
+                    continue
+                if item.media_type == _NCX_MEDIA_TYPE:
+                    return (posixpath.join(package.opf_dir, item.href), "ncx")
+                # properties is a space-separated list, e.g. "nav scripted"
+                if nav_href is None and item.properties and "nav" in item.properties.split():
+                    nav_href = item.href
+            if nav_href is not None:
+                return (posixpath.join(package.opf_dir, nav_href), "nav")
+
+        # Fallback: search for common TOC file names
+        for name in self._zip.namelist():
+            if name.endswith(".ncx"):
+                return (name, "ncx")
+            lowered = name.lower()
+            if "nav.xhtml" in lowered or "toc.xhtml" in lowered:
+                return (name, "nav")
 
         return (None, None)
 
@@ -288,94 +637,45 @@ class EpubReader(EbookReader):
         chapters = []
 
         # Build file -> chapters map
-        file_to_chapters: dict[str, list[tuple[str | None, int]]] = {}
+        file_to_chapters: dict[str, list[tuple[str | None, int]]] = defaultdict(list)
         for idx, ch in enumerate(toc_chapters):
-            src = ch.get("src", ch.get("href", ""))
-            if "#" in src:
-                file_name, anchor = src.split("#", 1)
-            else:
-                file_name, anchor = src, None
-
-            if file_name not in file_to_chapters:
-                file_to_chapters[file_name] = []
-            file_to_chapters[file_name].append((anchor, idx))
-
-        chapter_paragraphs: dict[int, list[str]] = {
-            i: [] for i in range(len(toc_chapters))
-        }
-
-        # Get all items in reading order
-        for item in self.book.get_items():
-            if not hasattr(item, "get_content") or not hasattr(item, "get_name"):
-                continue
+            src = ch["src"] if "src" in ch else ch.get("href", "")
+            file_name, sep, anchor = src.partition("#")
+            file_to_chapters[_normalize_href(file_name)].append(
+                (anchor if sep else None, idx)
+            )
 
-            item_name = item.get_name()
+        # Only entries whose file was found get a slot; the rest read as empty.
+        chapter_paragraphs: dict[int, list[str]] = {}
 
-            if item_name not in file_to_chapters:
+        # Gather the raw bytes of every referenced item (cheap), then parse
+        # them — in parallel for larger books.
+        jobs: list[tuple[bytes, list[tuple[str | None, int]]]] = []
+        package = self._package
+        for item in package.manifest if package is not None else ():
+            if item.name is None or not item.is_document:
                 continue
-
-            chapter_entries = file_to_chapters[item_name]
-
-            try:
-                content = item.get_content()
-            except Exception:
+            chapter_entries = file_to_chapters.get(_normalize_href(item.name))
+            if chapter_entries is None:
                 continue
 
-            soup = BeautifulSoup(content, "html.parser")
-            self._clean_soup(soup)
+            content = self._read_item(item.name)
+            if content is not None:
+                jobs.append((content, chapter_entries))
 
-            if len(chapter_entries) == 1:
-                _, chapter_idx = chapter_entries[0]
-                # Use comprehensive paragraph extraction
-                chapter_paragraphs[chapter_idx] = self._extract_chapter_paragraphs(soup)
-            else:
-                # Multiple chapters in file - split by anchor
-                sorted_entries = self._get_sorted_entries(soup, chapter_entries)
-
-                for i, (pos, anchor, chapter_idx) in enumerate(sorted_entries):
-                    start_elem, end_elem = self._get_chapter_boundaries(
-                        soup, anchor, sorted_entries, i
-                    )
-
-                    if start_elem and end_elem:
-                        # Extract content between anchors
-                        chapter_soup = BeautifulSoup("", "html.parser")
-                        current = start_elem.find_next_sibling()
-                        while current and current != end_elem:
-                            chapter_soup.append(current)
-                            current = current.find_next_sibling()
-                        chapter_paragraphs[chapter_idx] = (
-                            self._extract_chapter_paragraphs(chapter_soup)
-                        )
-                    elif start_elem:
-                        # From start element to end of file
-                        chapter_soup = BeautifulSoup("", "html.parser")
-                        current = start_elem.find_next_sibling()
-                        while current:
-                            chapter_soup.append(current)
-                            current = current.find_next_sibling()
-                        chapter_paragraphs[chapter_idx] = (
-                            self._extract_chapter_paragraphs(chapter_soup)
-                        )
-                    else:
-                        # No anchor, try to get content from soup directly
-                        chapter_paragraphs[chapter_idx] = (
-                            self._extract_chapter_paragraphs(soup)
-                        )
+        for item_paragraphs in self._parse_items(jobs):
+            chapter_paragraphs.update(item_paragraphs)
 
         # Create Chapter objects
         chapter_idx = 1
         for toc_idx, toc_ch in enumerate(toc_chapters):
-            paragraphs = chapter_paragraphs[toc_idx]
+            paragraphs = chapter_paragraphs.get(toc_idx, ())
             word_count = sum(len(p.split()) for p in paragraphs)
             tags = ChapterClassifier.classify(toc_ch["title"], word_count=word_count)
 
             if paragraphs:
-                content = " ".join(paragraphs)
-                if len(content) >= min_text_len:
-                    if paragraphs and toc_ch["title"].lower().endswith(
-                        paragraphs[0].lower()
-                    ):
+                if _joined_length(paragraphs) >= min_text_len:
+                    if paragraphs and _repeats_title(toc_ch["title"], paragraphs[0]):
                         paragraphs = paragraphs[1:]
 
                     chapters.append(
@@ -402,44 +702,119 @@ class EpubReader(EbookReader):
 
         return chapters
 
-    def _get_sorted_entries(self, soup, chapter_entries):
+    def _parse_items(
+        self, jobs: list[tuple[bytes, list[tuple[str | None, int]]]]
+    ) -> list[dict[int, list[str]]]:
+        """Run _extract_item_paragraphs over *jobs*, preserving their order.
+
+        Parses in-process by default. A process pool is used only when
+        PARSE_WORKERS opts in and the items add up to at least
+        _PARALLEL_MIN_BYTES of HTML; any failure to run the pool falls back
+        to in-process parsing.
+        """
+        workers = self.PARSE_WORKERS
+        if workers > 1 and sum(len(content) for content, _ in jobs) >= _PARALLEL_MIN_BYTES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(_parse_item_worker, jobs, chunksize=8))
+            except Exception as e:
+                if self.verbose:
+                    print(f"Parallel chapter parsing failed ({e}); parsing serially")
+        return [_parse_item_worker(job) for job in jobs]
+
+    @classmethod
+    def _extract_item_paragraphs(
+        cls, content: bytes, chapter_entries: list[tuple[str | None, int]]
+    ) -> dict[int, list[str]]:
+        """Extract paragraphs for every TOC entry that points into one item.
+
+        Returns a mapping of TOC index to paragraphs.
+        """
+        soup = cls._parse_document(content)
+
+        if len(chapter_entries) == 1:
+            _, chapter_idx = chapter_entries[0]
+            # Use comprehensive paragraph extraction
+            return {chapter_idx: cls._extract_chapter_paragraphs(soup)}
+
+        # Multiple chapters in file - split by anchor
+        paragraphs: dict[int, list[str]] = {}
+        anchors = cls._index_anchors(soup, {a for a, _ in chapter_entries if a})
+        sorted_entries = cls._get_sorted_entries(anchors, chapter_entries)
+
+        for i, (pos, anchor, chapter_idx) in enumerate(sorted_entries):
+            start_elem, end_elem = cls._get_chapter_boundaries(
+                anchors, anchor, sorted_entries, i
+            )
+
+            if start_elem is not None:
+                # Siblings after the anchor, up to the next chapter's anchor
+                # or the end of the file. They are collected, not moved, so
+                # the tree stays intact for the following chapters.
+                nodes = []
+                current = _next_tag(start_elem)
+                while current is not None and current != end_elem:
+                    nodes.append(current)
+                    current = _next_tag(current)
+                paragraphs[chapter_idx] = cls._extract_chapter_paragraphs(_LxmlRun(nodes))
+            else:
+                # No anchor, try to get content from the document directly
+                paragraphs[chapter_idx] = cls._extract_chapter_paragraphs(soup)
+
+        return paragraphs
+
+    @staticmethod
+    def _index_anchors(doc: _LxmlRun, anchors: set[str]) -> dict[str, tuple[Any, int]]:
+        """Locate each anchor in one pass over the document.
+
+        Maps an anchor to the first tag whose ``id`` equals it (or, failing
+        that, whose ``name`` does) and to that tag's position: the number of
+        tags before it in document order.
+        """
+        by_id: dict[str, tuple[Any, int]] = {}
+        by_name: dict[str, tuple[Any, int]] = {}
+        position = 0
+        for node in _iter_tags(doc):
+            elem_id = node.get("id")
+            if elem_id in anchors and elem_id not in by_id:
+                by_id[elem_id] = (node, position)
+            name = node.get("name")
+            if name in anchors and name not in by_name:
+                by_name[name] = (node, position)
+            position += 1
+        return {**by_name, **by_id}
+
+    @staticmethod
+    def _get_sorted_entries(anchors, chapter_entries):
         """Sort chapter entries by position in document."""
         sorted_entries = []
         for anchor, chapter_idx in chapter_entries:
             if anchor:
-                elem = soup.find(id=anchor) or soup.find(attrs={"name": anchor})
-                if elem:
-                    position = len(list(elem.find_all_previous()))
-                    sorted_entries.append((position, anchor, chapter_idx))
-                else:
-                    sorted_entries.append((float("inf"), anchor, chapter_idx))
+                found = anchors.get(anchor)
+                position = found[1] if found else float("inf")
+                sorted_entries.append((position, anchor, chapter_idx))
             else:
                 sorted_entries.append((0, anchor, chapter_idx))
 
-        sorted_entries.sort(key=lambda x: x[0])
+        sorted_entries.sort(key=itemgetter(0))
         return sorted_entries
 
-    def _get_chapter_boundaries(self, soup, anchor, sorted_entries, i):
+    @staticmethod
+    def _get_chapter_boundaries(anchors, anchor, sorted_entries, i):
         """Get start and end elements for a chapter."""
-        if anchor:
-            start_elem = soup.find(id=anchor) or soup.find(attrs={"name": anchor})
-        else:
-            start_elem = None
+        found = anchors.get(anchor) if anchor else None
+        start_elem = found[0] if found else None
 
+        end_elem = None
         if i + 1 < len(sorted_entries):
             next_anchor = sorted_entries[i + 1][1]
-            if next_anchor:
-                end_elem = soup.find(id=next_anchor) or soup.find(
-                    attrs={"name": next_anchor}
-                )
-            else:
-                end_elem = None
-        else:
-            end_elem = None
+            found = anchors.get(next_anchor) if next_anchor else None
+            end_elem = found[0] if found else None
 
         return start_elem, end_elem
 
-    def _extract_chapter_paragraphs(self, soup: BeautifulSoup) -> list[str]:
+    @classmethod
+    def _extract_chapter_paragraphs(cls, soup: _LxmlRun) -> list[str]:
         """Extract paragraphs from a chapter, handling various EPUB structures.
 
         This method handles:
@@ -454,17 +829,16 @@ class EpubReader(EbookReader):
 
         # Strategy 1: Try to find a main content section
         section = soup.find("section")
-        if section:
+        if section is not None:
             # Extract from section, looking at direct children first
-            for child in section.children:
-                if hasattr(child, "name") and child.name:
-                    text = self._clean_text(self._extract_text_with_italic_markers(child))
-                    if text and len(text) >= 2:
-                        paragraphs.append(text)
+            for child in _child_tags(section):
+                text = cls._clean_text(cls._extract_text_with_italic_markers(child))
+                if text and len(text) >= 2:
+                    paragraphs.append(text)
 
             # If no direct children worked, get all text from section
             if not paragraphs:
-                text = self._clean_text(section.get_text(separator="\n"))
+                text = cls._clean_text(_get_text(section, "\n"))
                 if text:
                     # Split by double newlines or multiple spaces
                     lines = [
@@ -481,25 +855,21 @@ class EpubReader(EbookReader):
 
         # Strategy 2: Standard <p> and <div> elements
         if not paragraphs:
-            for elem in soup.find_all(["p", "div"]):
-                if elem.find_parent(["p", "div"]):
-                    continue
-                text = self._clean_text(self._extract_text_with_italic_markers(elem))
+            for elem in _lxml_blocks(soup.contents, _BLOCK_TAGS, _BLOCK_TAGS):
+                text = cls._clean_text(cls._extract_text_with_italic_markers(elem))
                 if text and len(text) >= 2:
                     paragraphs.append(text)
 
         # Strategy 3: Handle script/dialogue format (<b> tags for speakers)
         # This is crucial for books like "Anxious People" where dialogue is in <b> tags
-        if not paragraphs or len(" ".join(paragraphs)) < 100:
+        if _joined_length(paragraphs) < 100:
             # Get all text content and try to segment it
             all_text = soup.get_text(separator="|")
 
             # Split by speaker names (typically in <b> tags, followed by colon)
-            # Pattern: |SPEAKER: dialogue|
-            import re
-
-            # Split on patterns like "SPEAKER:" where SPEAKER is in caps
-            parts = re.split(r"\|\s*([A-Z][A-Z\s]+):\s*", all_text)
+            # Pattern: |SPEAKER: dialogue|. Without a colon there is nothing
+            # to split, so plain prose skips the regex scan.
+            parts = _DIALOGUE_SPLIT_RE.split(all_text) if ":" in all_text else ()
 
             if len(parts) > 1:
                 # We have dialogue format - reconstruct paragraphs
@@ -547,44 +917,32 @@ class EpubReader(EbookReader):
         current_vol = ""
         current_book = ""
 
-        for item in self.book.get_items():
-            if not hasattr(item, "get_content") or not hasattr(item, "get_name"):
-                continue
-            try:
-                content = item.get_content()
-            except Exception:
-                continue
-
-            soup = BeautifulSoup(content, "html.parser")
-            self._clean_soup(soup)
-
-            elements = soup.find_all(["h1", "h2", "h3", "h4", "p", "div", "section"])
+        for name, content in self._iter_spine_items():
+            soup = self._parse_document(content)
 
-            current_chapter_title = toc_map.get(item.get_name(), "")
+            current_chapter_title = toc_map.get(name, "")
             current_paragraphs: list[str] = []
 
-            for elem in elements:
-                if elem.find_parent(["p", "h1", "h2", "h3", "h4", "section"]):
-                    continue
-
+            for elem in _lxml_blocks(soup.contents, _FALLBACK_TAGS, _FALLBACK_CONTAINERS):
                 text = self._clean_text(self._extract_text_with_italic_markers(elem))
                 if not text or len(text) < 2:
                     continue
 
-                # Check for Volume/Book markers
-                if re.match(r"^(volume|part)\s+[ivxlcdm\d]+", text, re.I):
-                    current_vol = text
-                    continue
-                if re.match(r"^book\s+(?:the\s+)?(?:[ivxlcdm\d]+|[a-z]+)", text, re.I):
-                    current_book = text
-                    continue
-
-                # Check for Chapter markers
-                chap_match = re.match(
-                    r"^(chapter\s+[ivxlcdm\d]+|(?=[IVXLCDM]+\.)[IVXLCDM]+)([\.\-\—\s:]+)(.*)$",
-                    text,
-                    re.I,
-                )
+                # Check for Volume/Book markers; body text rarely starts with
+                # a letter any header can, so most paragraphs skip both scans.
+                if text[0] in _HEADER_INITIALS:
+                    division = _DIVISION_HEADER_RE.match(text)
+                    if division:
+                        if division.lastgroup == "volume":
+                            current_vol = text
+                        else:
+                            current_book = text
+                        continue
+
+                    # Check for Chapter markers
+                    chap_match = _CHAPTER_HEADER_RE.match(text)
+                else:
+                    chap_match = None
 
                 if chap_match:
                     if current_paragraphs:
@@ -602,7 +960,7 @@ class EpubReader(EbookReader):
                     prefix += f"{current_book}, " if current_book else ""
 
                     if len(remaining_text) > 200 and "." in remaining_text:
-                        parts = re.split(r"(?<=\.)\s+", remaining_text, maxsplit=1)
+                        parts = _SENTENCE_END_RE.split(remaining_text, maxsplit=1)
                         current_chapter_title = f"{prefix}{header_label}: {parts[0]}"
                         current_paragraphs = [parts[1]] if len(parts) > 1 else []
                     else:
@@ -621,13 +979,12 @@ class EpubReader(EbookReader):
         return chapters
 
     def _add_chapter(self, chapters, title, paragraphs, min_len, toc_index: int = 0):
-        content = " ".join(paragraphs)
-        if len(content) < min_len:
+        if _joined_length(paragraphs) < min_len:
             return
 
         final_title = title if title else f"Chapter {len(chapters) + 1}"
 
-        if paragraphs and final_title.lower().endswith(paragraphs[0].lower()):
+        if paragraphs and _repeats_title(final_title, paragraphs[0]):
             paragraphs = paragraphs[1:]
 
         word_count = sum(len(p.split()) for p in paragraphs)
@@ -644,62 +1001,131 @@ class EpubReader(EbookReader):
         )
 
     def _build_toc_map(self) -> dict[str, str]:
-        toc_map = {}
+        """Map document names to titles of top-level, childless TOC entries.
+
+        Nested entries are deliberately left out: the fallback extractor only
+        uses these titles for documents that map to a whole TOC entry.
+        """
+        toc_map: dict[str, str] = {}
+        toc_file, toc_type = self._toc_file
+        toc_xml = self._toc_bytes
+        if toc_xml is None:
+            return toc_map
+
+        if toc_type == "ncx":
+            try:
+                return self._stream_ncx_leaves(toc_xml)
+            except Exception:
+                return toc_map
 
-        def traverse(nodes):
-            for node in nodes:
-                if hasattr(node, "href") and hasattr(node, "title"):
-                    toc_map[node.href.split("#")[0]] = node.title
-                elif hasattr(node, "children"):
-                    traverse(node.children)
+        try:
+            root = ET.fromstring(toc_xml)
+        except Exception:
+            return toc_map
 
-        if hasattr(self.book, "toc"):
-            traverse(self.book.toc)
+        # EPUB3 NAV: hrefs are relative to the NAV document
+        toc_nav = next(
+            (n for n in root.iter(_XHTML_NAV_TAG) if "toc" in n.attrib.values()),
+            None,
+        )
+        toc_list = toc_nav.find("xhtml:ol", _XHTML_NS) if toc_nav is not None else None
+        if toc_list is None:
+            return toc_map
+        base = posixpath.dirname(posixpath.relpath(toc_file, self._package.opf_dir or "."))
+        for li in toc_list.findall("xhtml:li", _XHTML_NS):
+            link = li.find("xhtml:a", _XHTML_NS)
+            if li.find("xhtml:ol", _XHTML_NS) is not None or link is None:
+                continue
+            href = link.get("href")
+            if href:
+                path = posixpath.normpath(posixpath.join(base, href))
+                toc_map[path.split("#")[0]] = "".join(link.itertext())
         return toc_map
 
-    def _clean_soup(self, soup: BeautifulSoup):
-        for t in soup.find_all(["sup", "script", "style", "nav", "footer"]):
-            t.decompose()
-        for t in soup.find_all(
-            class_=re.compile(r"page-?number|hidden|metadata|footnote", re.I)
-        ):
-            t.decompose()
+    @staticmethod
+    def _stream_ncx_leaves(ncx_xml: bytes) -> dict[str, str]:
+        """NCX half of ``_build_toc_map``, read with iterparse.
+
+        Only element depth is tracked, not the tree: a navPoint counts when
+        it sits directly under the navMap (depth 3, below the root and the
+        navMap) and no navPoint opens inside it.
+        """
+        toc_map: dict[str, str] = {}
+        depth = 0
+        in_nav_map = False
+        # One flag per open navPoint: has a nested navPoint been seen?
+        open_points: list[bool] = []
+        for event, elem in ET.iterparse(io.BytesIO(ncx_xml), events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if elem.tag == _NCX_NAVMAP_TAG and depth == 2:
+                    in_nav_map = True
+                elif elem.tag == _NCX_NAVPOINT_TAG:
+                    if open_points:
+                        open_points[-1] = True
+                    open_points.append(False)
+                continue
+
+            depth -= 1
+            if elem.tag == _NCX_NAVMAP_TAG and in_nav_map and depth == 1:
+                break  # ElementTree's find() would only have looked at the first
+            if elem.tag != _NCX_NAVPOINT_TAG:
+                continue
+            has_children = open_points.pop()
+            if in_nav_map and depth == 2 and not has_children:
+                label = elem.find("ncx:navLabel/ncx:text", _NCX_NS)
+                content = elem.find("ncx:content", _NCX_NS)
+                src = content.get("src", "") if content is not None else ""
+                toc_map[src.split("#")[0]] = label.text if label is not None else ""
+            elem.clear()
+        return toc_map
 
-    def _extract_text_with_italic_markers(self, elem) -> str:
-        """Extract text from a BeautifulSoup element, wrapping <em>/<i> content
+    @staticmethod
+    def _parse_document(content: bytes) -> _LxmlRun:
+        """Parse an item with lxml and strip the noise tags."""
+        return _lxml_document(content)
+
+    @staticmethod
+    def _extract_text_with_italic_markers(elem) -> str:
+        """Extract text from an lxml element, wrapping <em>/<i> content
         with STX (\\x02) / ETX (\\x03) markers so the NLP pipeline can detect
         italicised inner monologue as a distinct speech kind.
 
         All other markup is transparent — only <em> and <i> are wrapped.
-        The result is passed through ``_clean_text()`` by the caller.
+        The result is passed through ``_clean_text()`` by the caller, which
+        does the only whitespace normalization.
         """
-        from bs4 import NavigableString
-
-        parts: list[str] = []
-        for child in elem.children:
-            if isinstance(child, NavigableString):
-                s = str(child)
-                if s:
-                    parts.append(s)
-            elif hasattr(child, "name"):
-                if child.name in ("em", "i"):
-                    inner = child.get_text("").strip()
-                    if inner:
-                        parts.append(f"\x02{inner}\x03")
-                else:
-                    inner = self._extract_text_with_italic_markers(child)
-                    if inner:
-                        parts.append(inner)
-        return " ".join(parts)
+        return _lxml_marked_text(elem)
 
     @staticmethod
     def _clean_text(text: str) -> str:
-        text = text.encode("utf-8", errors="replace").decode("utf-8")
-        return re.sub(r"\s+", " ", text).strip()
+        text = " ".join(text.split())
+        # Lone surrogates cannot be encoded later on; replace them with "?"
+        # (what an encode/decode round-trip with errors="replace" produced).
+        # Encoding is a quicker test for them than a regex search.
+        if not text.isascii():
+            try:
+                text.encode("utf-8")
+            except UnicodeEncodeError:
+                text = _SURROGATE_RE.sub("?", text)
+        return text
 
     def get_cover(self) -> tuple[bytes | None, str | None]:
         """Extract cover image from EPUB."""
-        return extract_epub_cover(self.filepath)
+        return self._cover
+
+    @cached_property
+    def _cover(self) -> tuple[bytes | None, str | None]:
+        """Cover image and MIME type, read from the open archive once."""
+        return extract_epub_cover_from_zip(self._zip)
+
+
+def _parse_item_worker(
+    job: tuple[bytes, list[tuple[str | None, int]]],
+) -> dict[int, list[str]]:
+    """Process-pool entry point for EpubReader._extract_item_paragraphs."""
+    content, chapter_entries = job
+    return EpubReader._extract_item_paragraphs(content, chapter_entries)
 
 
 __all__ = ["EpubReader"]
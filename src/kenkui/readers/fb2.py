@@ -6,16 +6,110 @@ Provides EbookReader interface for FB2 files using standard XML parsing.
 
 from __future__ import annotations
 
+import os
+import posixpath
+import threading
 import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
 from pathlib import Path
-from xml.etree import ElementTree as ET
+from typing import IO
+
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    from xml.etree import ElementTree as ET
 
 from ..chapter_classifier import ChapterClassifier
 from ..models import Chapter
-from . import EbookMetadata, EbookReader, Registry, TocEntry
+from . import EbookMetadata, EbookReader, Registry, TocEntry, _joined_length
 
 FB2_NS = {"fb": "http://www.gribuser.ru/xml/fictionbook/2/0"}
 
+# Query paths shared by the tree and streaming walks (see _xpath).
+_SECTIONS = "fb:section"
+_TITLE_P = "fb:title/fb:p"
+_SUBTITLE = "fb:subtitle"
+_PARAGRAPHS = ".//fb:p"
+
+# Cover image extensions, in order of preference.
+_IMG_EXTS = (".jpg", ".jpeg", ".png")
+
+_PARSE_OPTIONS = {
+    "remove_comments": True,
+    "remove_pis": True,
+    "resolve_entities": False,
+    "huge_tree": True,
+    "recover": True,
+    "collect_ids": False,
+}
+
+_parsers = threading.local()
+
+
+def _xml_parser():
+    """Return a parser matching ElementTree's view of the document.
+
+    ElementTree drops comments and processing instructions, which keeps
+    ``elem.text`` whole around them; lxml needs telling. ``recover`` lets
+    mildly malformed books (stray ``&``, unclosed tags) load instead of
+    failing outright. Parsers are not thread-safe, so each thread builds one
+    and reuses it.
+    """
+    if ET.__name__ != "lxml.etree":
+        return None
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = ET.XMLParser(**_PARSE_OPTIONS)
+    return parser
+
+
+def _image_mime(name: str) -> str:
+    return "image/png" if name.lower().endswith(".png") else "image/jpeg"
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _children_by_name(element: ET.Element) -> dict[str, list[ET.Element]]:
+    """Group an element's children by local name, in document order."""
+    children: dict[str, list[ET.Element]] = {}
+    for child in element:
+        if isinstance(child.tag, str):
+            children.setdefault(_local_name(child.tag), []).append(child)
+    return children
+
+
+def _namespace(tag: str) -> str:
+    return tag[1:].partition("}")[0] if tag.startswith("{") else ""
+
+
+@lru_cache(maxsize=None)
+def _xpath(path: str, ns: str):
+    """Compile an ``fb:``-prefixed path for documents in namespace ``ns``.
+
+    Books that declare no namespace get the path with its prefixes dropped,
+    so one query serves both. Without lxml, ElementPath stands in.
+    """
+    if not ns:
+        path = path.replace("fb:", "")
+    if ET.__name__ != "lxml.etree":
+        return lambda element: element.findall(path, {"fb": ns})
+    return ET.XPath(path, namespaces={"fb": ns} if ns else None)
+
+
+class _OpenSection:
+    """A ``<section>`` the streaming walk has entered but not yet closed."""
+
+    __slots__ = ("element", "title", "has_children")
+
+    def __init__(self, element: ET.Element):
+        self.element = element
+        self.title: str | None = None
+        self.has_children = False
+
 
 @Registry.register
 class Fb2Reader(EbookReader):
@@ -23,108 +117,218 @@ class Fb2Reader(EbookReader):
 
     SUPPORTED_EXTENSIONS = {".fb2", ".fb2.zip"}
 
+    # Books whose XML is larger than this are never held as one tree: only
+    # <description> is kept, and the body is streamed section by section.
+    STREAM_THRESHOLD: int = 32 * 1024 * 1024
+
     def __init__(self, filepath: Path, verbose: bool = False):
         super().__init__(filepath, verbose)
         self._tree: ET.ElementTree | None = None
         self._root: ET.Element | None = None
+        self._member: str | None = None
+        self._streaming = False
         self._cover_data: tuple[bytes | None, str | None] = (None, None)
-
-        self._parse()
-
-    def _parse(self):
-        """Parse the FB2 file (can be XML or ZIP)."""
-        if self.filepath.suffix.lower() == ".zip" or self.filepath.name.endswith(
+        # Namespace the document declares ("" for none); queries follow it.
+        self._ns: str = FB2_NS["fb"]
+        # Nothing is read until asked for: metadata needs only <description>,
+        # the TOC and chapters need the body.
+        self._header_parsed = False
+        self._full_parsed = False
+
+    def _is_zipped(self) -> bool:
+        return self.filepath.suffix.lower() == ".zip" or self.filepath.name.endswith(
             ".fb2.zip"
-        ):
-            self._parse_zip()
-        else:
-            self._parse_xml(self.filepath)
+        )
 
-    def _parse_zip(self):
-        """Parse FB2 file inside a ZIP archive."""
+    def _should_stream(self, size: int) -> bool:
+        # The streaming walk relies on lxml's tag filter and getparent().
+        return size > self.STREAM_THRESHOLD and ET.__name__ == "lxml.etree"
+
+    def _ensure_header_parsed(self):
+        """Read ``<description>`` unless the book has been parsed already."""
+        if self._header_parsed:
+            return
+        if ET.__name__ != "lxml.etree":
+            # Stopping early relies on lxml's iterparse tag filter.
+            self._ensure_full_parsed()
+            return
+        self._header_parsed = True
+        self._parse(header_only=True)
+
+    def _ensure_full_parsed(self):
+        """Parse the whole book, unless its body is to be streamed."""
+        if self._full_parsed:
+            return
+        self._full_parsed = True
+        if self._header_parsed and self._streaming:
+            return
+        self._header_parsed = True
+        self._parse(header_only=False)
+
+    def _parse(self, header_only: bool):
+        """Parse the FB2 file (can be XML or ZIP).
+
+        Only ``<description>`` is read when ``header_only`` is set or the book
+        is large enough to be streamed.
+        """
         try:
-            with zipfile.ZipFile(self.filepath, "r") as zf:
-                # Find the fb2 file inside
-                fb2_files = [f for f in zf.namelist() if f.lower().endswith(".fb2")]
-                if fb2_files:
-                    content = zf.read(fb2_files[0])
-                    self._parse_xml_content(content)
-
-                    # Try to find cover
-                    self._extract_cover_from_zip(zf)
+            if self._is_zipped():
+                with zipfile.ZipFile(self.filepath, "r") as zf:
+                    # Find the fb2 file inside
+                    fb2_files = [f for f in zf.namelist() if f.lower().endswith(".fb2")]
+                    if not fb2_files:
+                        return
+                    self._member = fb2_files[0]
+                    size = zf.getinfo(self._member).file_size
+                    self._streaming = self._should_stream(size)
+                    with zf.open(self._member) as stream:
+                        if header_only or self._streaming:
+                            self._parse_description(stream)
+                        else:
+                            self._parse_tree(stream)
+            else:
+                self._streaming = self._should_stream(self.filepath.stat().st_size)
+                if header_only or self._streaming:
+                    self._parse_description(os.fspath(self.filepath))
+                else:
+                    self._parse_tree(os.fspath(self.filepath))
         except Exception as e:
             if self.verbose:
-                print(f"Error parsing ZIP: {e}")
+                print(f"Error parsing FB2: {e}")
+
+    def _parse_tree(self, source: str | IO[bytes]):
+        """Parse the whole book from a path or binary stream.
 
-    def _parse_xml(self, filepath: Path):
-        """Parse FB2 XML file directly."""
+        The parser reads the source in chunks, so no copy of the file is held
+        alongside the tree, and it honours the XML declaration's encoding
+        (windows-1251 is common in FB2).
+        """
         try:
-            with open(filepath, "rb") as f:
-                content = f.read()
-            self._parse_xml_content(content)
+            self._tree = ET.parse(source, _xml_parser())
+            self._root = self._tree.getroot()
+            if self._root is not None:
+                self._ns = _namespace(self._root.tag)
 
-            # Try to find cover in same directory
-            self._extract_cover_from_path(filepath)
-        except Exception as e:
+        except ET.ParseError as e:
             if self.verbose:
-                print(f"Error parsing XML: {e}")
+                print(f"XML parse error: {e}")
 
-    def _parse_xml_content(self, content: bytes):
-        """Parse XML content into element tree."""
+    def _parse_description(self, source: str | IO[bytes]):
+        """Read only ``<description>``, for metadata or a streamed book.
+
+        Parsing stops once ``<description>`` ends or ``<body>`` starts, so
+        the root holds just the description; a streamed body is left for
+        :meth:`_stream_sections` to walk on demand.
+        """
+        events = ET.iterparse(
+            source,
+            events=("start", "end"),
+            tag=("{*}description", "{*}body"),
+            **_PARSE_OPTIONS,
+        )
+        for event, elem in events:
+            if event == "end" or _local_name(elem.tag) == "body":
+                self._root = elem.getroottree().getroot()
+                self._ns = _namespace(self._root.tag)
+                break
+
+    @cached_property
+    def _cover(self) -> tuple[bytes | None, str | None]:
+        """Cover image and MIME type, looked up on first use."""
         try:
-            # Remove XML declaration if present
-            if content.startswith(b"<?xml"):
-                content = content.split(b"?>", 1)[1]
+            if self._is_zipped():
+                with zipfile.ZipFile(self.filepath, "r") as zf:
+                    self._extract_cover_from_zip(zf)
+            else:
+                self._extract_cover_from_path(self.filepath)
+        except Exception as e:
+            if self.verbose:
+                print(f"Error reading FB2 cover: {e}")
+        return self._cover_data
 
-            self._tree = ET.fromstring(content)
-            self._root = self._tree
+    @cached_property
+    def _bodies(self) -> list[ET.Element]:
+        """The parsed tree's ``<body>`` elements; the first is the main text."""
+        if self._root is None:
+            return []
+        return self._findall(self._root, "fb:body")
 
-            # Handle namespace
-            if "}" in self._tree.tag:
-                ns = self._tree.tag.split("}")[0].strip("{")
-                FB2_NS["fb"] = ns
+    def _find(self, element: ET.Element, path: str) -> ET.Element | None:
+        found = _xpath(path, self._ns)(element)
+        return found[0] if found else None
 
-        except ET.ParseError as e:
-            if self.verbose:
-                print(f"XML parse error: {e}")
+    def _findall(self, element: ET.Element, path: str) -> list[ET.Element]:
+        return _xpath(path, self._ns)(element)
+
+    @contextmanager
+    def _open_book(self) -> Iterator[IO[bytes]]:
+        """Open the FB2 XML as a binary stream, inside the archive if zipped."""
+        if self._member is not None:
+            with zipfile.ZipFile(self.filepath, "r") as zf:
+                with zf.open(self._member) as stream:
+                    yield stream
+        else:
+            with open(self.filepath, "rb") as stream:
+                yield stream
 
     def _extract_cover_from_path(self, filepath: Path):
-        """Try to find cover image in same directory."""
-        base = filepath.with_suffix("")
-        for ext in [".jpg", ".jpeg", ".png"]:
-            cover_path = filepath.parent / f"{base.name}-cover{ext}"
-            if not cover_path.exists():
-                cover_path = filepath.parent / f"cover{ext}"
-
-            if cover_path.exists():
-                try:
-                    with open(cover_path, "rb") as f:
-                        data = f.read()
-                    mime = "image/jpeg" if ext in (".jpg", ".jpeg") else "image/png"
-                    self._cover_data = (data, mime)
-                    return
-                except Exception:
-                    pass
+        """Try to find cover image in same directory.
+
+        ``<book>-cover.<ext>`` wins over ``cover.<ext>``, and extensions are
+        tried in ``_IMG_EXTS`` order. One directory scan answers every
+        candidate instead of a stat per name.
+        """
+        base = filepath.with_suffix("").name
+        candidates = [
+            name for ext in _IMG_EXTS for name in (f"{base}-cover{ext}", f"cover{ext}")
+        ]
+        try:
+            with os.scandir(filepath.parent) as it:
+                found = {entry.name: entry for entry in it if entry.name in candidates}
+        except OSError:
+            return
+
+        for name in candidates:
+            entry = found.get(name)
+            if entry is None:
+                continue
+            try:
+                if not entry.is_file() or entry.stat().st_size == 0:
+                    continue
+                with open(entry.path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
+            self._cover_data = (data, _image_mime(name))
+            return
 
     def _extract_cover_from_zip(self, zf: zipfile.ZipFile):
-        """Extract cover from ZIP archive."""
-        for name in zf.namelist():
-            lower_name = name.lower()
-            if "cover" in lower_name and lower_name.endswith((".jpg", ".jpeg", ".png")):
-                try:
-                    data = zf.read(name)
-                    mime = (
-                        "image/jpeg"
-                        if lower_name.endswith((".jpg", ".jpeg"))
-                        else "image/png"
-                    )
-                    self._cover_data = (data, mime)
-                    return
-                except Exception:
-                    pass
+        """Extract cover from ZIP archive.
+
+        Takes the first image whose file name starts with "cover", else the
+        first with "cover" anywhere in its path.
+        """
+        best = None
+        for info in zf.infolist():
+            name = info.filename.lower()
+            if "cover" not in name or not name.endswith(_IMG_EXTS):
+                continue
+            if posixpath.basename(name).startswith("cover"):
+                best = info
+                break
+            if best is None:
+                best = info
+
+        if best is None:
+            return
+        try:
+            self._cover_data = (zf.read(best), _image_mime(best.filename))
+        except Exception:
+            pass
 
-    def get_metadata(self) -> EbookMetadata:
+    def _load_metadata(self) -> EbookMetadata:
         """Extract metadata from FB2."""
+        self._ensure_header_parsed()
         title = self.filepath.stem
         author = None
         language = None
@@ -138,94 +342,85 @@ class Fb2Reader(EbookReader):
                 language=language,
                 publisher=publisher,
                 description=description,
-                cover_image=self._cover_data[0],
-                cover_mime_type=self._cover_data[1],
+                cover_image=self._cover[0],
+                cover_mime_type=self._cover[1],
             )
 
         # Get title
-        title_info = self._root.find(".//fb:title-info", FB2_NS)
-        if title_info is None:
-            title_info = self._root.find(".//title-info")
+        title_info = self._find(self._root, "fb:description/fb:title-info")
 
         if title_info is not None:
+            fields = _children_by_name(title_info)
+
             # Title
-            title_elem = title_info.find(".//fb:book-title", FB2_NS)
-            if title_elem is None:
-                title_elem = title_info.find(".//book-title")
+            title_elem = fields.get("book-title", [None])[0]
             if title_elem is not None and title_elem.text:
                 title = title_elem.text.strip()
 
             # Author
             authors = []
-            for author_elem in title_info.findall(".//fb:author", FB2_NS):
-                if author_elem is None:
-                    author_elem = title_info.find(".//author")
-                if author_elem is not None:
-                    first = author_elem.find(".//fb:first-name", FB2_NS)
-                    if first is None:
-                        first = author_elem.find(".//first-name")
-                    last = author_elem.find(".//fb:last-name", FB2_NS)
-                    if last is None:
-                        last = author_elem.find(".//last-name")
-
-                    name_parts = []
-                    if first is not None and first.text:
-                        name_parts.append(first.text.strip())
-                    if last is not None and last.text:
-                        name_parts.append(last.text.strip())
-
-                    if name_parts:
-                        authors.append(" ".join(name_parts))
+            for author_elem in fields.get("author", ()):
+                name = _children_by_name(author_elem)
+                name_parts = []
+                for part in ("first-name", "last-name"):
+                    part_elem = name.get(part, [None])[0]
+                    if part_elem is not None and part_elem.text:
+                        name_parts.append(part_elem.text.strip())
+
+                if name_parts:
+                    authors.append(" ".join(name_parts))
 
             if authors:
                 author = ", ".join(authors)
 
             # Language
-            lang_elem = title_info.find(".//fb:lang", FB2_NS)
-            if lang_elem is None:
-                lang_elem = title_info.find(".//lang")
+            lang_elem = fields.get("lang", [None])[0]
             if lang_elem is not None and lang_elem.text:
                 language = lang_elem.text.strip()
 
-            # Publisher
-            publish_info = title_info.find(".//fb:publish-info", FB2_NS)
-            if publish_info is None:
-                publish_info = title_info.find(".//publish-info")
-            if publish_info is not None:
-                publisher_elem = publish_info.find(".//fb:publisher", FB2_NS)
-                if publisher_elem is None:
-                    publisher_elem = publish_info.find(".//publisher")
-                if publisher_elem is not None and publisher_elem.text:
-                    publisher = publisher_elem.text.strip()
-
             # Description/Annotation
-            annotation = title_info.find(".//fb:annotation", FB2_NS)
-            if annotation is None:
-                annotation = title_info.find(".//annotation")
+            annotation = fields.get("annotation", [None])[0]
             if annotation is not None:
                 desc_parts = []
-                for p in annotation.findall(".//fb:p", FB2_NS):
-                    if p is None:
-                        p = annotation.find(".//p")
-                    if p is not None and p.text:
+                for p in self._findall(annotation, _PARAGRAPHS):
+                    if p.text:
                         desc_parts.append(p.text.strip())
                 if desc_parts:
                     description = "\n".join(desc_parts)
 
+        # Publisher (publish-info sits beside title-info, not inside it)
+        publisher_elem = self._find(
+            self._root, "fb:description/fb:publish-info/fb:publisher"
+        )
+        if publisher_elem is not None and publisher_elem.text:
+            publisher = publisher_elem.text.strip()
+
         return EbookMetadata(
             title=title,
             author=author,
             language=language,
             publisher=publisher,
             description=description,
-            cover_image=self._cover_data[0],
-            cover_mime_type=self._cover_data[1],
+            cover_image=self._cover[0],
+            cover_mime_type=self._cover[1],
         )
 
-    def get_toc(self) -> list[TocEntry]:
+    def _load_toc(self) -> list[TocEntry]:
         """Extract table of contents from FB2."""
+        self._ensure_full_parsed()
         toc = []
 
+        if self._streaming:
+            # The streamed root holds only <description>; a <toc> further on
+            # is picked up by the walk. Either way only the first one counts.
+            toc_elem = self._find(self._root, ".//fb:toc") if self._root is not None else None
+            if toc_elem is not None:
+                toc = self._toc_links(toc_elem)
+                if toc:
+                    return toc
+            links = self._stream_sections(None, toc, find_toc=toc_elem is None)
+            return links or toc
+
         if self._root is None:
             return toc
 
@@ -233,196 +428,238 @@ class Fb2Reader(EbookReader):
         # Title can be in <title><p> or <title><p>subtitle</p></title>
 
         # First try to get from description TOC
-        toc_elem = self._root.find(".//fb:toc", FB2_NS)
-        if toc_elem is None:
-            toc_elem = self._root.find(".//toc")
+        toc_elem = self._find(self._root, ".//fb:toc")
 
         if toc_elem is not None:
-            for link in toc_elem.findall(".//fb:link", FB2_NS):
-                if link is None:
-                    link = toc_elem.find(".//link")
-                if link is not None:
-                    title = link.find(".//fb:p", FB2_NS)
-                    if title is None:
-                        title = link.find(".//p")
-                    title_text = (
-                        title.text if title is not None and title.text else "Untitled"
-                    )
-                    href = link.get("href", "")
-
-                    toc.append(
-                        TocEntry(
-                            title=title_text.strip(),
-                            href=href,
-                        )
-                    )
-
+            toc = self._toc_links(toc_elem)
             if toc:
                 return toc
 
         # Fallback: extract from body sections
-        bodies = self._root.findall(".//fb:body", FB2_NS)
-        if not bodies:
-            bodies = self._root.findall(".//body")
-
         level = 0
-        for body in bodies:
+        for body in self._bodies:
             self._extract_sections_from_body(body, toc, level)
 
         return toc
 
+    def _toc_links(self, toc_elem: ET.Element) -> list[TocEntry]:
+        """Return an entry for each ``<link>`` of a ``<toc>`` element."""
+        toc = []
+        for link in self._findall(toc_elem, ".//fb:link"):
+            title = self._find(link, _PARAGRAPHS)
+            title_text = title.text if title is not None and title.text else "Untitled"
+            toc.append(TocEntry(title=title_text.strip(), href=link.get("href", "")))
+        return toc
+
     def _extract_sections_from_body(
         self, element: ET.Element, toc: list[TocEntry], level: int
     ):
-        """Recursively extract section titles from body."""
-        for section in element.findall(".//fb:section", FB2_NS):
-            if section is None:
-                section = element.findall(".//section")
-
-            # Get title
-            title = section.find(".//fb:title//fb:p", FB2_NS)
-            if title is None:
-                title = section.find(".//title//p")
-            if title is None:
-                title = section.find(".//fb:subtitle", FB2_NS)
-            if title is None:
-                title = section.find(".//subtitle")
-
-            title_text = ""
-            if title is not None and title.text:
-                title_text = title.text.strip()
-            elif title is not None:
-                title_text = " ".join(t.strip() for t in title.itertext() if t.strip())
+        """Extract section titles from body, depth first without recursion."""
+        stack = [(section, level) for section in reversed(self._findall(element, _SECTIONS))]
+        while stack:
+            section, depth = stack.pop()
+            title_text = self._section_title(section)
 
             if title_text:
                 toc.append(
                     TocEntry(
                         title=title_text,
                         href="",
-                        level=level,
+                        level=depth,
                     )
                 )
 
-            # Recurse into nested sections
-            self._extract_sections_from_body(section, toc, level + 1)
+            # Nested sections come next, in document order
+            children = self._findall(section, _SECTIONS)
+            stack.extend((child, depth + 1) for child in reversed(children))
 
     def get_chapters(self, min_text_len: int = 50) -> list[Chapter]:
         """Extract chapters from FB2."""
+        self._ensure_full_parsed()
         chapters = []
 
-        if self._root is None:
+        if self._streaming:
+            self._stream_sections(chapters, None)
             return chapters
 
-        # Get all sections in the main body
-        bodies = self._root.findall(".//fb:body", FB2_NS)
-        if not bodies:
-            bodies = self._root.findall(".//body")
-
         # Use first body as main content
-        main_body = bodies[0] if bodies else None
-
-        if main_body is None:
+        if not self._bodies:
             return chapters
 
-        chapter_idx = 1
-        self._extract_chapters_recursive(main_body, chapters, "", 0, chapter_idx)
-
-        # Renumber chapters
-        for i, ch in enumerate(chapters):
-            ch.index = i + 1
+        self._extract_chapters(self._bodies[0], chapters)
 
         return chapters
 
-    def _extract_chapters_recursive(
-        self,
-        element: ET.Element,
-        chapters: list[Chapter],
-        parent_title: str,
-        level: int,
-        chapter_idx: int,
-    ) -> int:
-        """Recursively extract chapters from sections."""
-        sections = element.findall(".//fb:section", FB2_NS)
-        if not sections:
-            sections = element.findall(".//section")
+    def _extract_chapters(self, body: ET.Element, chapters: list[Chapter]):
+        """Turn the leaf sections under ``body`` into chapters, in order.
 
+        Walks with an explicit stack, so deeply nested books cannot hit the
+        recursion limit. A section's title is settled when it is popped, after
+        every earlier leaf has been emitted, so "Section N" fallbacks count
+        the same chapters as in document order.
+        """
+        sections = self._findall(body, _SECTIONS)
         if not sections:
-            # This section has content, extract it
-            content = self._extract_section_content(element)
-            full_text = " ".join(content)
-
-            if len(full_text) >= 50:
-                # Get title from this element
-                title = parent_title or f"Section {len(chapters) + 1}"
-
-                # Skip if just whitespace
-                if not title.strip():
-                    title = f"Section {len(chapters) + 1}"
-
-                word_count = sum(len(p.split()) for p in content)
-                tags = ChapterClassifier.classify(title, word_count=word_count)
-
-                chapters.append(
-                    Chapter(
-                        index=chapter_idx,
-                        title=title,
-                        paragraphs=content,
-                        tags=tags,
-                        toc_index=len(chapters),
-                    )
-                )
-                chapter_idx += 1
+            # No sections: the body itself is the content
+            self._append_chapter(body, "", chapters)
+            return
+
+        stack = [(section, "") for section in reversed(sections)]
+        while stack:
+            section, parent_title = stack.pop()
+            full_title = self._full_title(
+                parent_title, self._section_title(section), len(chapters)
+            )
+            children = self._findall(section, _SECTIONS)
+            if children:
+                stack.extend((child, full_title) for child in reversed(children))
+            else:
+                self._append_chapter(section, full_title, chapters)
+
+    def _stream_sections(
+        self,
+        chapters: list[Chapter] | None,
+        toc: list[TocEntry] | None,
+        find_toc: bool = False,
+    ) -> list[TocEntry]:
+        """Walk the book's bodies without building their tree.
+
+        Produces what ``_extract_chapters`` (into ``chapters``, main
+        body only) and the body-section TOC (into ``toc``, every body) would.
+        A section's ``<title>``
+        precedes its nested sections, so it is read when the first child
+        starts, or at the end tag for a leaf. Closed sections and the
+        siblings before them are dropped, keeping only the open path alive.
+
+        With ``find_toc`` set, the links of the first ``<toc>`` met on the
+        way are returned; otherwise the result is empty.
+        """
+        stack: list[_OpenSection] = []
+        has_sections = False
+        links: list[TocEntry] | None = None
+        tags = ("{*}body", "{*}section", "{*}toc") if find_toc else ("{*}body", "{*}section")
+        with self._open_book() as stream:
+            events = ET.iterparse(
+                stream,
+                events=("start", "end"),
+                tag=tags,
+                **_PARSE_OPTIONS,
+            )
+            for event, elem in events:
+                name = _local_name(elem.tag)
+                if name == "toc":
+                    if event == "end" and links is None:
+                        links = self._toc_links(elem)
+                    continue
+                if name == "body":
+                    if event == "start":
+                        has_sections = False
+                        continue
+                    if chapters is None:
+                        elem.clear(keep_tail=False)
+                        continue
+                    if not has_sections:
+                        self._append_chapter(elem, "", chapters)
+                    break
+
+                has_sections = True
+                if event == "start":
+                    if stack and stack[-1].title is None:
+                        self._settle_title(stack, chapters, toc)
+                    if stack:
+                        stack[-1].has_children = True
+                    stack.append(_OpenSection(elem))
+                    continue
+
+                if stack[-1].title is None:
+                    self._settle_title(stack, chapters, toc)
+                section = stack.pop()
+                if not section.has_children and chapters is not None:
+                    self._append_chapter(elem, section.title, chapters)
+                elem.clear(keep_tail=False)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        return links or []
+
+    def _settle_title(
+        self,
+        stack: list[_OpenSection],
+        chapters: list[Chapter] | None,
+        toc: list[TocEntry] | None,
+    ):
+        """Record the title of the innermost open section."""
+        section = stack[-1]
+        title = self._section_title(section.element)
+        if toc is not None and title:
+            toc.append(TocEntry(title=title, href="", level=len(stack) - 1))
+        if chapters is None:
+            section.title = title
         else:
-            for section in sections:
-                # Get title
-                title_elem = section.find(".//fb:title//fb:p", FB2_NS)
-                if title_elem is None:
-                    title_elem = section.find(".//title//p")
-                if title_elem is None:
-                    title_elem = section.find(".//fb:subtitle", FB2_NS)
-                if title_elem is None:
-                    title_elem = section.find(".//subtitle")
-
-                section_title = ""
-                if title_elem is not None and title_elem.text:
-                    section_title = title_elem.text.strip()
-                elif title_elem is not None:
-                    section_title = " ".join(
-                        t.strip() for t in title_elem.itertext() if t.strip()
-                    )
+            parent_title = stack[-2].title if len(stack) > 1 else ""
+            section.title = self._full_title(parent_title, title, len(chapters))
+
+    def _section_title(self, section: ET.Element) -> str:
+        """Return the text of a section's own ``<title>`` (or ``<subtitle>``)."""
+        title_elem = self._find(section, _TITLE_P)
+        if title_elem is None:
+            title_elem = self._find(section, _SUBTITLE)
+
+        if title_elem is None:
+            return ""
+        if len(title_elem) == 0:
+            return (title_elem.text or "").strip()
+        # Inline markup: join the pieces, then collapse the whitespace between them
+        return " ".join("".join(title_elem.itertext()).split())
+
+    @staticmethod
+    def _full_title(parent_title: str, section_title: str, count: int) -> str:
+        """Build a section's title path under its parent's."""
+        if parent_title and section_title:
+            return f"{parent_title}: {section_title}"
+        if parent_title:
+            return parent_title
+        return section_title or f"Section {count + 1}"
+
+    def _append_chapter(
+        self, element: ET.Element, title: str, chapters: list[Chapter]
+    ):
+        """Turn a leaf section into a chapter if it has enough text."""
+        content = self._extract_section_content(element)
+        if _joined_length(content) < 50:
+            return
 
-                # Build full title path
-                if parent_title and section_title:
-                    full_title = f"{parent_title}: {section_title}"
-                elif parent_title:
-                    full_title = parent_title
-                else:
-                    full_title = section_title or f"Section {len(chapters) + 1}"
+        # Titles are built from stripped parts, so only the body itself has none
+        if not title:
+            title = f"Section {len(chapters) + 1}"
 
-                chapter_idx = self._extract_chapters_recursive(
-                    section, chapters, full_title, level + 1, chapter_idx
-                )
+        word_count = sum(len(p.split()) for p in content)
+        tags = ChapterClassifier.classify(title, word_count=word_count)
 
-        return chapter_idx
+        chapters.append(
+            Chapter(
+                index=len(chapters) + 1,
+                title=title,
+                paragraphs=content,
+                tags=tags,
+                toc_index=len(chapters),
+            )
+        )
 
     def _extract_section_content(self, section: ET.Element) -> list[str]:
         """Extract text content from a section."""
         paragraphs = []
 
         # Get all p tags in this section
-        for p in section.findall(".//fb:p", FB2_NS):
-            if p is None:
-                p = section.find(".//p")
-            if p is not None:
-                text = "".join(p.itertext()).strip()
-                if text:
-                    paragraphs.append(text)
+        for p in self._findall(section, _PARAGRAPHS):
+            text = "".join(p.itertext()).strip()
+            if text:
+                paragraphs.append(text)
 
         return paragraphs
 
     def get_cover(self) -> tuple[bytes | None, str | None]:
         """Extract cover image."""
-        return self._cover_data
+        return self._cover
 
 
 __all__ = ["Fb2Reader"]
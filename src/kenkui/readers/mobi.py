@@ -6,16 +6,218 @@ Provides EbookReader interface for MOBI and AZW formats using the mobi library.
 
 from __future__ import annotations
 
+import io
+import os
+import posixpath
 import re
 import shutil
 import tempfile
+from collections.abc import Iterator
+from functools import cached_property
 from pathlib import Path
+from urllib.parse import unquote
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree as ET
 
 from ..chapter_classifier import ChapterClassifier
 from ..models import Chapter
-from . import EbookMetadata, EbookReader, Registry, TocEntry
+from . import (
+    EbookMetadata,
+    EbookReader,
+    Registry,
+    TocEntry,
+    _joined_length,
+)
+
+# Patterns used in the per-element extraction loops, compiled once.
+_LEADING_NUMBER_RE = re.compile(r"^[0-9]+\.?")
+_VOLUME_HEADER_RE = re.compile(r"^(volume|part)\s+[ivxlcdm\d]+", re.I)
+_BOOK_HEADER_RE = re.compile(r"^book\s+(?:the\s+)?(?:[ivxlcdm\d]+|[a-z]+)", re.I)
+_CHAPTER_HEADER_RE = re.compile(
+    r"^(chapter\s+[ivxlcdm\d]+|(?=[IVXLCDM]+\.)[IVXLCDM]+)([\.\-\—\s:]+)(.*)$", re.I
+)
+# Letters a volume, book or chapter header can begin with (under re.I the
+# Turkish dotted and dotless I also match "i").
+_HEADER_INITIALS = frozenset("bcdilmpvxBCDILMPVX\u0130\u0131")
+_SENTENCE_END_RE = re.compile(r"(?<=\.)\s+")
+_CLEAN_CLASS_RE = re.compile(r"page-?number|hidden|metadata|footnote", re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+# File names that are not chapters: for the filename-based TOC (matched on
+# the stem) and for the fallback extractor (matched on the whole name).
+_TOC_SKIP_NAME_RE = re.compile(r"cover|copyright|toc|nav|title|dedication|acknowledg", re.I)
+_FILE_SKIP_NAME_RE = re.compile(r"cover|copyright|toc|nav|titlepage|dedication", re.I)
+_SURROGATE_RE = re.compile("[\ud800-\udfff]")
+
+# Cover file names looked for, in order, in the top directory and images/.
+_COVER_CANDIDATES = (
+    ("", ("cover.jpg", "cover.jpeg", "cover.png", "Cover.jpg", "Cover.jpeg", "Cover.png")),
+    ("images", ("cover.jpg", "cover.jpeg", "cover.png")),
+)
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png"})
+# Any other image must be larger than this to pass for a cover, not an icon.
+_MIN_COVER_BYTES = 5000
+
+# Leading characters of a first paragraph compared against the chapter title.
+_TITLE_REPEAT_CHARS = 50
+
+_STRIP_TAGS = frozenset({"script", "style", "nav"})
+_BLOCK_TAGS = frozenset({"p", "div"})
+_ITALIC_TAGS = frozenset({"em", "i"})
+# Tags whose text BeautifulSoup files under its own string types, which
+# get_text() leaves out; the streaming path skips them to match.
+_NON_CONTENT_TAGS = frozenset({"rt", "rp", "template"})
+_FALLBACK_TAGS = frozenset({"h1", "h2", "h3", "h4", "p", "div"})
+_FALLBACK_CONTAINERS = frozenset({"p", "h1", "h2", "h3", "h4"})
+
+# Only the tags each pass reads are built into the tree. The body strainer also
+# keeps the wrappers ``_clean_soup`` may drop, so blocks inside them stay out.
+_META_STRAINER = SoupStrainer(["title", "meta", "dc:creator"])
+_LINK_STRAINER = SoupStrainer("a")
+_BODY_STRAINER = SoupStrainer(
+    sorted(_FALLBACK_TAGS | {"nav", "aside", "section", "blockquote"})
+)
+
+
+def _make_soup(content: bytes | str, parse_only=None):
+    """Parse HTML into BeautifulSoup with the lxml tree builder.
+
+    *parse_only* is passed through to BeautifulSoup to build only the
+    matching tags.
+    """
+    return BeautifulSoup(content, "lxml", parse_only=parse_only)
+
+
+def _iter_blocks(root, names: frozenset[str], containers: frozenset[str]):
+    """Yield tags in *names* that have no ancestor in *containers*.
+
+    Equivalent to ``[e for e in root.find_all(names) if not e.find_parent(containers)]``
+    but walks the tree once, in document order, and never descends into a
+    container, so nested elements cost nothing instead of an ancestor walk each.
+    """
+    stack = list(reversed(root.contents))
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, Tag):
+            continue
+        if node.name in names:
+            yield node
+        if node.name not in containers:
+            stack.extend(reversed(node.contents))
+
+
+def _is_noise(elem) -> bool:
+    """Return True for the lxml elements ``MobiReader._clean_soup`` removes."""
+    return elem.tag in _STRIP_TAGS or bool(_CLEAN_CLASS_RE.search(elem.get("class", "")))
+
+
+def _lxml_contents(elem) -> list:
+    """*elem*'s children interleaved with its text and tails, like ``Tag.contents``."""
+    contents = [elem.text] if elem.text else []
+    for child in elem:
+        contents.append(child)
+        if child.tail:
+            contents.append(child.tail)
+    return contents
+
+
+def _lxml_strings(elem) -> Iterator[str]:
+    """Yield the strings ``Tag.get_text()`` would join for a cleaned *elem*."""
+    stack = _lxml_contents(elem)
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            yield node
+        elif (
+            isinstance(node.tag, str)
+            and node.tag not in _NON_CONTENT_TAGS
+            and not _is_noise(node)
+        ):
+            stack.extend(reversed(_lxml_contents(node)))
+
+
+def _lxml_marked_text(elem) -> str:
+    """lxml version of ``MobiReader._extract_text_with_italic_markers``.
+
+    Removed elements are skipped in place, so the text comes out as it does
+    from a soup that ``_clean_soup`` has been run on.
+    """
+    parts: list[str] = []
+    stack = _lxml_contents(elem)
+    stack.reverse()
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            parts.append(node)
+        elif not isinstance(node.tag, str):
+            # The soup walk takes comments as strings too.
+            if node.text:
+                parts.append(node.text)
+        elif _is_noise(node):
+            continue
+        elif node.tag in _ITALIC_TAGS:
+            inner = "".join(_lxml_strings(node)).strip()
+            if inner:
+                parts.append(f"\x02{inner}\x03")
+        else:
+            stack.extend(reversed(_lxml_contents(node)))
+    return " ".join(parts)
+
+
+def _stream_blocks(html_content: str) -> Iterator:
+    """Yield each outermost ``<p>``/``<div>`` of *html_content* as it is parsed.
+
+    Blocks inside removed elements are passed over. The caller reads each
+    block before asking for the next; it is then cleared, along with
+    everything before it, so the tree never grows past one block.
+    """
+    blocks = noise = 0
+    events = ET.iterparse(
+        io.BytesIO(html_content.encode("utf-8")),
+        events=("start", "end"),
+        html=True,
+        encoding="utf-8",
+    )
+    for event, elem in events:
+        if _is_noise(elem):
+            noise += 1 if event == "start" else -1
+        elif noise or elem.tag not in _BLOCK_TAGS:
+            continue
+        elif event == "start":
+            blocks += 1
+        else:
+            blocks -= 1
+            if not blocks:
+                yield elem
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+
+def _file_names(folder) -> list[str]:
+    """Names of the regular files directly in *folder*, in listing order."""
+    try:
+        with os.scandir(folder) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+    except OSError:
+        return []
+
+
+def _toc_rank(name: str) -> int:
+    """Order TOC file candidates: lowercase-"toc" HTML, then XHTML, then the rest."""
+    if "toc" in name:
+        return 0 if name.endswith(".html") else 1
+    return 2
+
+
+def _repeats_title(title: str, paragraph: str) -> bool:
+    """Return True if *title* ends with the start of *paragraph*, ignoring case.
+
+    Only the leading ``_TITLE_REPEAT_CHARS`` characters are case-folded, not
+    the whole paragraph.
+    """
+    return title.casefold().endswith(paragraph[:_TITLE_REPEAT_CHARS].casefold())
 
 
 @Registry.register
@@ -30,7 +232,12 @@ class MobiReader(EbookReader):
         self._extracted_html: Path | None = None
         self._extracted_dir: Path | None = None
         self._html_files: list[Path] = []
+        # Each HTML file's path relative to the extraction directory
+        self._html_relpaths: dict[Path, str] = {}
         self._cover_info: tuple[bytes | None, str | None] = (None, None)
+        # Extracted files are read, and their paragraphs extracted, once.
+        self._html_text: dict[Path, str] = {}
+        self._html_paragraphs: dict[Path, list[str]] = {}
 
         self._extract()
 
@@ -53,19 +260,22 @@ class MobiReader(EbookReader):
             if main_file and Path(main_file).exists():
                 self._extracted_html = Path(main_file)
             else:
-                # Try to find the HTML file in the extracted directory
-                html_files = list(self._extracted_dir.glob("*.html")) + list(
-                    self._extracted_dir.glob("*.xhtml")
-                )
-                if html_files:
-                    # Sort by name to get reading order
-                    html_files.sort(key=lambda x: x.name)
-                    self._extracted_html = html_files[0]
+                # Try to find the HTML file in the extracted directory; the
+                # first by name comes first in reading order
+                html_names = [
+                    name for name in self._top_files if name.endswith((".html", ".xhtml"))
+                ]
+                if html_names:
+                    self._extracted_html = self._extracted_dir / min(html_names)
 
             # Find all HTML files for chapter extraction
             self._html_files = sorted(
                 self._extracted_dir.glob("**/*.html"), key=lambda x: x.name
             )
+            self._html_relpaths = {
+                html_file: str(html_file.relative_to(self._extracted_dir))
+                for html_file in self._html_files
+            }
 
             # Extract cover image
             self._extract_cover()
@@ -80,55 +290,49 @@ class MobiReader(EbookReader):
         if not self._extracted_dir:
             return
 
-        # Look for common cover image names
-        cover_names = [
-            "cover.jpg",
-            "cover.jpeg",
-            "cover.png",
-            "Cover.jpg",
-            "Cover.jpeg",
-            "Cover.png",
-            "images/cover.jpg",
-            "images/cover.jpeg",
-            "images/cover.png",
-        ]
-
-        for cover_name in cover_names:
-            cover_path = self._extracted_dir / cover_name
-            if cover_path.exists():
-                try:
-                    with open(cover_path, "rb") as f:
-                        data = f.read()
-                    mime = (
-                        "image/jpeg"
-                        if cover_name.lower().endswith((".jpg", ".jpeg"))
-                        else "image/png"
-                    )
-                    self._cover_info = (data, mime)
+        # Look for common cover image names, listing each directory once
+        for subdir, cover_names in _COVER_CANDIDATES:
+            folder = os.path.join(self._extracted_dir, subdir)
+            files = set(_file_names(folder) if subdir else self._top_files)
+            for cover_name in cover_names:
+                if cover_name in files and self._read_cover(
+                    os.path.join(folder, cover_name)
+                ):
                     return
-                except Exception:
-                    continue
 
         # Try to find any image in the directory that might be a cover
-        for img_path in self._extracted_dir.glob("**/*"):
-            if img_path.suffix.lower() in (".jpg", ".jpeg", ".png"):
-                # Heuristic: cover is usually one of the first images
+        for root, _dirs, names in os.walk(self._extracted_dir):
+            for name in names:
+                if os.path.splitext(name)[1].lower() not in _IMAGE_EXTS:
+                    continue
+                path = os.path.join(root, name)
+                # Heuristic: cover is usually one of the first images, and
+                # reasonably sized (not a tiny icon)
                 try:
-                    with open(img_path, "rb") as f:
-                        data = f.read()
-                    # Check if it's reasonably sized (not a tiny icon)
-                    if len(data) > 5000:
-                        mime = (
-                            "image/jpeg"
-                            if img_path.suffix.lower() in (".jpg", ".jpeg")
-                            else "image/png"
-                        )
-                        self._cover_info = (data, mime)
-                        return
-                except Exception:
+                    if os.stat(path).st_size <= _MIN_COVER_BYTES:
+                        continue
+                except OSError:
                     continue
+                if self._read_cover(path):
+                    return
 
-    def get_metadata(self) -> EbookMetadata:
+    @cached_property
+    def _top_files(self) -> list[str]:
+        """Files directly in the extraction directory, listed once and shared."""
+        return _file_names(self._extracted_dir) if self._extracted_dir else []
+
+    def _read_cover(self, path: str) -> bool:
+        """Store the image at *path* as the cover; return False if unreadable."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+        mime = "image/jpeg" if path.lower().endswith((".jpg", ".jpeg")) else "image/png"
+        self._cover_info = (data, mime)
+        return True
+
+    def _load_metadata(self) -> EbookMetadata:
         """Extract metadata from MOBI."""
         title = self.filepath.stem
         author = None
@@ -136,12 +340,7 @@ class MobiReader(EbookReader):
         # Try to get metadata from the main HTML file
         if self._extracted_html and self._extracted_html.exists():
             try:
-                with open(
-                    self._extracted_html, encoding="utf-8", errors="ignore"
-                ) as f:
-                    html_content = f.read()
-
-                soup = BeautifulSoup(html_content, "html.parser")
+                soup = _make_soup(self._read_html(self._extracted_html), _META_STRAINER)
 
                 # Look for title in metadata
                 title_tag = soup.find("title")
@@ -172,7 +371,7 @@ class MobiReader(EbookReader):
             cover_mime_type=self._cover_info[1],
         )
 
-    def get_toc(self) -> list[TocEntry]:
+    def _load_toc(self) -> list[TocEntry]:
         """Extract table of contents from MOBI.
 
         MOBI files often don't have a formal TOC, so we try multiple approaches.
@@ -181,18 +380,20 @@ class MobiReader(EbookReader):
 
         # Try to find a separate TOC file
         if self._extracted_dir:
-            toc_files = (
-                list(self._extracted_dir.glob("*toc*.html"))
-                + list(self._extracted_dir.glob("*toc*.xhtml"))
-                + list(self._extracted_dir.glob("*TOC*.html"))
+            # One listing, matched without regard to case
+            toc_names = sorted(
+                (
+                    name
+                    for name in self._top_files
+                    if "toc" in (lower := name.lower()) and lower.endswith((".html", ".xhtml"))
+                ),
+                key=_toc_rank,
             )
+            toc_files = [self._extracted_dir / name for name in toc_names]
 
             for toc_file in toc_files:
                 try:
-                    with open(toc_file, encoding="utf-8", errors="ignore") as f:
-                        toc_content = f.read()
-
-                    soup = BeautifulSoup(toc_content, "html.parser")
+                    soup = _make_soup(self._read_html(toc_file), _LINK_STRAINER)
 
                     # Look for links (common in MOBI TOCs)
                     for link in soup.find_all("a"):
@@ -212,32 +413,18 @@ class MobiReader(EbookReader):
                 # Use filename as chapter title
                 title = html_file.stem
                 # Skip common non-chapter files
-                lower_name = title.lower()
-                if any(
-                    skip in lower_name
-                    for skip in [
-                        "cover",
-                        "copyright",
-                        "toc",
-                        "nav",
-                        "title",
-                        "dedication",
-                        "acknowledg",
-                    ]
-                ):
+                if _TOC_SKIP_NAME_RE.search(title):
                     continue
 
                 # Clean up title
-                title = re.sub(r"^[0-9]+\.?", "", title)  # Remove leading numbers
+                title = _LEADING_NUMBER_RE.sub("", title)  # Remove leading numbers
                 title = title.replace("_", " ").replace("-", " ").strip()
 
                 if title:
                     toc_entries.append(
                         TocEntry(
                             title=title.title(),
-                            href=str(html_file.relative_to(self._extracted_dir))
-                            if self._extracted_dir
-                            else str(html_file),
+                            href=self._html_relpaths[html_file],
                         )
                     )
 
@@ -263,54 +450,61 @@ class MobiReader(EbookReader):
         chapters = []
         chapter_idx = 1
 
-        # Build a map of hrefs to content
-        html_content_map: dict[str, str] = {}
-        for html_file in self._html_files:
+        # Build a map of hrefs to the (readable) files they can name, and an
+        # index of the same files by lowercased relative path and file name
+        html_file_map: dict[str, Path] = {}
+        by_path: dict[str, Path] = {}
+        by_name: dict[str, Path] = {}
+        for html_file, rel_path in self._html_relpaths.items():
             try:
-                with open(html_file, encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                rel_path = (
-                    str(html_file.relative_to(self._extracted_dir))
-                    if self._extracted_dir
-                    else html_file.name
-                )
-                html_content_map[rel_path] = content
-                # Also try without path
-                html_content_map[html_file.name] = content
+                self._read_html(html_file)
             except Exception:
                 continue
+            html_file_map[rel_path] = html_file
+            # Also try without path
+            html_file_map[html_file.name] = html_file
+            by_path.setdefault(rel_path.replace(os.sep, "/").lower(), html_file)
+            by_name.setdefault(html_file.name.lower(), html_file)
+
+        # Keys as the title fallback compares them, built on first use
+        squashed_keys: list[tuple[str, Path]] | None = None
 
         for toc_entry in toc:
             href = toc_entry.href
             title = toc_entry.title
 
-            # Find matching content
-            content = None
-            for key, cnt in html_content_map.items():
-                if href in key or key in href:
-                    content = cnt
-                    break
+            # Find matching content: the file the href names, else the first
+            # key either side of the href contains
+            path = unquote(href.partition("#")[0]).lower()
+            match = (by_path.get(path) or by_name.get(posixpath.basename(path))) if path else None
+            if match is None:
+                for key, html_file in html_file_map.items():
+                    if href in key or key in href:
+                        match = html_file
+                        break
 
-            if content is None:
+            if match is None:
                 # Try to find by title matching filename
                 title_lower = title.lower().replace(" ", "")
-                for key, cnt in html_content_map.items():
-                    if title_lower in key.lower().replace(" ", "").replace("_", ""):
-                        content = cnt
+                if squashed_keys is None:
+                    squashed_keys = [
+                        (key.lower().replace(" ", "").replace("_", ""), html_file)
+                        for key, html_file in html_file_map.items()
+                    ]
+                for key, html_file in squashed_keys:
+                    if title_lower in key:
+                        match = html_file
                         break
 
-            if content:
-                paragraphs = self._extract_paragraphs(content)
-                full_text = " ".join(paragraphs)
+            if match is not None and self._read_html(match):
+                paragraphs = self._file_paragraphs(match)
 
-                if len(full_text) >= min_text_len:
+                if _joined_length(paragraphs) >= min_text_len:
                     word_count = sum(len(p.split()) for p in paragraphs)
                     tags = ChapterClassifier.classify(title, word_count=word_count)
 
                     # Clean up if title repeats first paragraph
-                    if paragraphs and title.lower().endswith(
-                        paragraphs[0].lower()[:50]
-                    ):
+                    if paragraphs and _repeats_title(title, paragraphs[0]):
                         paragraphs = paragraphs[1:]
 
                     chapters.append(
@@ -346,57 +540,40 @@ class MobiReader(EbookReader):
         current_book = ""
 
         for html_file in self._html_files:
-            try:
-                with open(html_file, encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-            except Exception:
+            # Skip non-chapter files
+            if _FILE_SKIP_NAME_RE.search(html_file.name):
                 continue
 
-            # Skip non-chapter files
-            lower_name = html_file.name.lower()
-            if any(
-                skip in lower_name
-                for skip in [
-                    "cover",
-                    "copyright",
-                    "toc",
-                    "nav",
-                    "titlepage",
-                    "dedication",
-                ]
-            ):
+            try:
+                content = self._read_html(html_file)
+            except Exception:
                 continue
 
-            soup = BeautifulSoup(content, "html.parser")
+            soup = _make_soup(content, _BODY_STRAINER)
             self._clean_soup(soup)
 
-            elements = soup.find_all(["h1", "h2", "h3", "h4", "p", "div"])
-
             current_chapter_title = html_file.stem
             current_paragraphs: list[str] = []
 
-            for elem in elements:
-                if elem.find_parent(["p", "h1", "h2", "h3", "h4"]):
-                    continue
-
+            for elem in _iter_blocks(soup, _FALLBACK_TAGS, _FALLBACK_CONTAINERS):
                 text = self._clean_text(self._extract_text_with_italic_markers(elem))
                 if not text or len(text) < 2:
                     continue
 
-                # Check for Volume/Book markers
-                if re.match(r"^(volume|part)\s+[ivxlcdm\d]+", text, re.I):
-                    current_vol = text
-                    continue
-                if re.match(r"^book\s+(?:the\s+)?(?:[ivxlcdm\d]+|[a-z]+)", text, re.I):
-                    current_book = text
-                    continue
-
-                # Check for Chapter markers
-                chap_match = re.match(
-                    r"^(chapter\s+[ivxlcdm\d]+|(?=[IVXLCDM]+\.)[IVXLCDM]+)([\.\-\—\s:]+)(.*)$",
-                    text,
-                    re.I,
-                )
+                # Check for Volume/Book markers, but only for text that
+                # could open a header at all.
+                if text[0] in _HEADER_INITIALS:
+                    if _VOLUME_HEADER_RE.match(text):
+                        current_vol = text
+                        continue
+                    if _BOOK_HEADER_RE.match(text):
+                        current_book = text
+                        continue
+
+                    # Check for Chapter markers
+                    chap_match = _CHAPTER_HEADER_RE.match(text)
+                else:
+                    chap_match = None
 
                 if chap_match:
                     if current_paragraphs:
@@ -415,7 +592,7 @@ class MobiReader(EbookReader):
                     prefix += f"{current_book}, " if current_book else ""
 
                     if len(remaining_text) > 200 and "." in remaining_text:
-                        parts = re.split(r"(?<=\.)\s+", remaining_text, maxsplit=1)
+                        parts = _SENTENCE_END_RE.split(remaining_text, maxsplit=1)
                         current_chapter_title = f"{prefix}{header_label}: {parts[0]}"
                         current_paragraphs = [parts[1]] if len(parts) > 1 else []
                     else:
@@ -437,15 +614,46 @@ class MobiReader(EbookReader):
 
         return chapters
 
+    def _read_html(self, path: Path) -> str:
+        """Return the text of extracted file *path*, reading it only once."""
+        text = self._html_text.get(path)
+        if text is None:
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                text = self._html_text[path] = f.read()
+        return text
+
+    def _file_paragraphs(self, path: Path) -> list[str]:
+        """Return the paragraphs of *path*, extracting them only once.
+
+        Several TOC entries often point into the same file; each gets its own
+        copy of the list.
+        """
+        paragraphs = self._html_paragraphs.get(path)
+        if paragraphs is None:
+            paragraphs = self._extract_paragraphs(self._read_html(path))
+            self._html_paragraphs[path] = paragraphs
+        return list(paragraphs)
+
     def _extract_paragraphs(self, html_content: str) -> list[str]:
-        """Extract paragraphs from HTML content."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        """Extract paragraphs from HTML content.
+
+        The HTML is streamed with lxml, one top-level block at a time; input
+        the stream cannot read goes through BeautifulSoup instead.
+        """
+        try:
+            return [
+                text
+                for elem in _stream_blocks(html_content)
+                if len(text := self._clean_text(_lxml_marked_text(elem))) >= 2
+            ]
+        except ET.LxmlError:
+            pass
+
+        soup = _make_soup(html_content, _BODY_STRAINER)
         self._clean_soup(soup)
 
         paragraphs = []
-        for elem in soup.find_all(["p", "div"]):
-            if elem.find_parent(["p", "div"]):
-                continue
+        for elem in _iter_blocks(soup, _BLOCK_TAGS, _BLOCK_TAGS):
             text = self._clean_text(self._extract_text_with_italic_markers(elem))
             if text and len(text) >= 2:
                 paragraphs.append(text)
@@ -460,13 +668,12 @@ class MobiReader(EbookReader):
         min_len: int,
         toc_index: int,
     ):
-        content = " ".join(paragraphs)
-        if len(content) < min_len:
+        if _joined_length(paragraphs) < min_len:
             return
 
         final_title = title if title else f"Chapter {len(chapters) + 1}"
 
-        if paragraphs and final_title.lower().endswith(paragraphs[0].lower()[:50]):
+        if paragraphs and _repeats_title(final_title, paragraphs[0]):
             paragraphs = paragraphs[1:]
 
         word_count = sum(len(p.split()) for p in paragraphs)
@@ -484,11 +691,9 @@ class MobiReader(EbookReader):
 
     def _clean_soup(self, soup: BeautifulSoup):
         """Clean HTML of unwanted elements."""
-        for t in soup.find_all(["script", "style", "nav"]):
+        for t in soup.find_all(_STRIP_TAGS):
             t.decompose()
-        for t in soup.find_all(
-            class_=re.compile(r"page-?number|hidden|metadata|footnote", re.I)
-        ):
+        for t in soup.find_all(class_=_CLEAN_CLASS_RE):
             t.decompose()
 
     def _extract_text_with_italic_markers(self, elem) -> str:
@@ -517,8 +722,11 @@ class MobiReader(EbookReader):
 
     @staticmethod
     def _clean_text(text: str) -> str:
-        text = text.encode("utf-8", errors="replace").decode("utf-8")
-        return re.sub(r"\s+", " ", text).strip()
+        # Lone surrogates are the only code points that fail to encode; an
+        # ASCII string cannot contain one, so skip the scan for those.
+        if not text.isascii():
+            text = _SURROGATE_RE.sub("?", text)
+        return _WHITESPACE_RE.sub(" ", text).strip()
 
     def get_cover(self) -> tuple[bytes | None, str | None]:
         """Extract cover image."""
@@ -526,6 +734,8 @@ class MobiReader(EbookReader):
 
     def cleanup(self):
         """Clean up temporary extraction directory."""
+        self._html_text.clear()
+        self._html_paragraphs.clear()
         if self._temp_dir and Path(self._temp_dir).exists():
             try:
                 shutil.rmtree(self._temp_dir)
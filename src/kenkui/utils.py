@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import os
 import re
-import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
 
+from lxml import etree as ET
+
 # Re-export from voice_registry — the registry is the single source of truth.
 from .voice_registry import BUILTIN_VOICE_NAMES as BUILTIN_VOICE_NAMES  # noqa: F401
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 def batch_text(
     paragraphs: list[str],
@@ -53,7 +56,7 @@ def batch_text(
 
     def _split_long(text: str) -> list[str]:
         """Split a single long paragraph at sentence boundaries."""
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         chunks: list[str] = []
         current: list[str] = []
         current_len = 0
@@ -164,6 +167,30 @@ def normalize_for_tts(text: str) -> str:
     return _NONT_PATTERN.sub(_replace_contraction, text)
 
 
+_CONTAINER_NS = {"container": "urn:oasis:names:tc:opendocument:xmlns:container"}
+_OPF_NS = {"opf": "http://www.idpf.org/2007/opf"}
+
+# The cover id comes from <meta name="cover">, else from the item marked as
+# the cover image; the cover is the first item with that id and an href.
+_META_COVER_XP = ET.XPath('(//opf:meta[@name="cover"])[1]/@content', namespaces=_OPF_NS)
+_COVER_PROP_XP = ET.XPath('(//opf:item[@properties="cover-image"])[1]/@id', namespaces=_OPF_NS)
+_ITEM_BY_ID_XP = ET.XPath("(//opf:item[@id=$id][@href])[1]", namespaces=_OPF_NS)
+
+
+def _parse_xml(data: bytes):
+    """Parse an XML document from an EPUB, without resolving entities."""
+    return ET.fromstring(data, ET.XMLParser(resolve_entities=False))
+
+
+def _opf_cover_item(opf_root):
+    """Return the manifest ``<item>`` the OPF names as its cover, or None."""
+    cover_id = next(iter(_META_COVER_XP(opf_root)), None) or next(
+        iter(_COVER_PROP_XP(opf_root)), None
+    )
+    items = _ITEM_BY_ID_XP(opf_root, id=cover_id) if cover_id else []
+    return items[0] if items else None
+
+
 def extract_epub_cover(epub_path: Path) -> tuple[bytes | None, str | None]:
     """Extract cover image from EPUB file.
 
@@ -172,75 +199,62 @@ def extract_epub_cover(epub_path: Path) -> tuple[bytes | None, str | None]:
     """
     try:
         with zipfile.ZipFile(str(epub_path), "r") as epub:
-            container = epub.read("META-INF/container.xml")
-            tree = ET.fromstring(container)
-
-            ns = {"container": "urn:oasis:names:tc:opendocument:xmlns:container"}
-            rootfile = tree.find(".//container:rootfile", ns)
-            if rootfile is None:
-                return None, None
-
-            opf_path = rootfile.get("full-path")
-            if opf_path is None:
-                return None, None
-
-            opf_content = epub.read(opf_path)
-            opf_tree = ET.fromstring(opf_content)
-
-            namespaces = {
-                "opf": "http://www.idpf.org/2007/opf",
-                "dc": "http://purl.org/dc/elements/1.1/",
-            }
-
-            cover_id = None
-
-            # Method 1: Look for meta tag with name="cover"
-            for meta in opf_tree.findall('.//opf:meta[@name="cover"]', namespaces):
-                cover_id = meta.get("content")
-                break
-
-            # Method 2: Look for item with properties="cover-image"
-            if not cover_id:
-                for item in opf_tree.findall('.//opf:item[@properties="cover-image"]', namespaces):
-                    cover_id = item.get("id")
-                    break
-
-            if cover_id:
-                for item in opf_tree.findall(".//opf:item", namespaces):
-                    if item.get("id") == cover_id:
-                        cover_href = item.get("href")
-                        if cover_href is None:
-                            continue
-                        mime_type = item.get("media-type", "")
-                        opf_dir = os.path.dirname(opf_path) or ""
-                        cover_path = os.path.join(opf_dir, cover_href).replace("\\", "/")
-
-                        cover_data = epub.read(cover_path)
-
-                        if not mime_type:
-                            ext = os.path.splitext(cover_path)[1].lower()
-                            mime_type = {
-                                ".jpg": "image/jpeg",
-                                ".jpeg": "image/jpeg",
-                                ".png": "image/png",
-                            }.get(ext, "image/jpeg")
-
-                        return cover_data, mime_type
-
-            # Fallback: Look for common cover image names
-            for name in epub.namelist():
-                lower_name = name.lower()
-                if "cover" in lower_name and any(
-                    lower_name.endswith(ext) for ext in [".jpg", ".jpeg", ".png"]
-                ):
-                    cover_data = epub.read(name)
-                    ext = os.path.splitext(name)[1].lower()
-                    mime_type = {
-                        ".jpg": "image/jpeg",
-                        ".jpeg": "image/jpeg",
-                        ".png": "image/png",
-                    }.get(ext, "image/jpeg")
-                    return cover_data, mime_type
+            return extract_epub_cover_from_zip(epub)
+    except Exception:
+        return None, None
+
+
+def extract_epub_cover_from_zip(epub: zipfile.ZipFile) -> tuple[bytes | None, str | None]:
+    """Extract the cover image from an already opened EPUB archive.
+
+    Returns:
+        Tuple of (image_data, mime_type) or (None, None) if not found.
+    """
+    try:
+        tree = _parse_xml(epub.read("META-INF/container.xml"))
+
+        rootfile = tree.find(".//container:rootfile", _CONTAINER_NS)
+        if rootfile is None:
+            return None, None
+
+        opf_path = rootfile.get("full-path")
+        if opf_path is None:
+            return None, None
+
+        # Named by <meta name="cover"> or properties="cover-image"
+        item = _opf_cover_item(_parse_xml(epub.read(opf_path)))
+        if item is not None:
+            cover_href = item.get("href")
+            mime_type = item.get("media-type", "")
+            opf_dir = os.path.dirname(opf_path) or ""
+            cover_path = os.path.join(opf_dir, cover_href).replace("\\", "/")
+
+            cover_data = epub.read(cover_path)
+
+            if not mime_type:
+                ext = os.path.splitext(cover_path)[1].lower()
+                mime_type = {
+                    ".jpg": "image/jpeg",
+                    ".jpeg": "image/jpeg",
+                    ".png": "image/png",
+                }.get(ext, "image/jpeg")
+
+            return cover_data, mime_type
+
+        # Fallback: Look for common cover image names
+        for name in epub.namelist():
+            lower_name = name.lower()
+            if "cover" in lower_name and any(
+                lower_name.endswith(ext) for ext in [".jpg", ".jpeg", ".png"]
+            ):
+                cover_data = epub.read(name)
+                ext = os.path.splitext(name)[1].lower()
+                mime_type = {
+                    ".jpg": "image/jpeg",
+                    ".jpeg": "image/jpeg",
+                    ".png": "image/png",
+                }.get(ext, "image/jpeg")
+                return cover_data, mime_type
 
     except Exception:
         pass
@@ -248,15 +262,27 @@ def extract_epub_cover(epub_path: Path) -> tuple[bytes | None, str | None]:
     return None, None
 
 
+_UNSAFE_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+
+
 def sanitize_filename(name: str) -> str:
     """Remove special characters from filename."""
-    return re.sub(r'[\\/*?:"<>|]', "", name).strip()
+    return _UNSAFE_FILENAME_RE.sub("", name).strip()
+
+
+_SURROGATE_RE = re.compile("[\ud800-\udfff]")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def clean_text(text: str) -> str:
-    """Normalize text and handle encoding issues."""
-    text = text.encode("utf-8", errors="replace").decode("utf-8")
-    return re.sub(r"\s+", " ", text).strip()
+    """Normalize text and handle encoding issues.
+
+    Lone surrogates become "?", as a UTF-8 round-trip with
+    ``errors="replace"`` would make them, without copying the text twice.
+    """
+    if not text.isascii():
+        text = _SURROGATE_RE.sub("?", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 __all__ = [
@@ -264,6 +290,7 @@ __all__ = [
     "VOICE_DESCRIPTIONS",
     "batch_text",
     "extract_epub_cover",
+    "extract_epub_cover_from_zip",
     "sanitize_filename",
     "clean_text",
 ]
@@ -182,6 +182,25 @@ def get_batch_info(chapter: Chapter, is_first_chapter: bool = False) -> tuple[in
     return len(batches), total_chars
 
 
+# ---------------------------------------------------------------------------
+# Per-process state shared with the parent process
+# ---------------------------------------------------------------------------
+
+# Installed by init_worker() when the pool starts.  A plain
+# multiprocessing.Queue can only reach workers by inheritance, not as a
+# submitted task argument; the config dict is the same for every chapter, so
+# it is sent once per process instead of being pickled with each task.
+_progress_queue: multiprocessing.Queue | None = None
+_worker_config: dict | None = None
+
+
+def init_worker(queue: multiprocessing.Queue, config_dict: dict | None = None) -> None:
+    """ProcessPoolExecutor initializer: install the progress queue and config."""
+    global _progress_queue, _worker_config
+    _progress_queue = queue
+    _worker_config = config_dict
+
+
 # ---------------------------------------------------------------------------
 # Top-level worker entry point
 # ---------------------------------------------------------------------------
@@ -189,15 +208,21 @@ def get_batch_info(chapter: Chapter, is_first_chapter: bool = False) -> tuple[in
 
 def worker_process_chapter(
     chapter: Chapter,
-    config_dict: dict,
+    config_dict: dict | None,
     temp_dir: Path,
-    queue: multiprocessing.Queue,
+    queue: multiprocessing.Queue | None,
     is_first_chapter: bool = False,
 ) -> AudioResult | None:
     """Process a single chapter, retrying up to 2 times on failure.
 
-    Executed inside a subprocess worker via ``ProcessPoolExecutor``.
+    Executed inside a subprocess worker via ``ProcessPoolExecutor``.  When
+    *config_dict* or *queue* is None, the one installed by init_worker() is
+    used.
     """
+    if config_dict is None:
+        config_dict = _worker_config or {}
+    if queue is None:
+        queue = _progress_queue
     # Configure logging for this worker process on first chapter call.
     # setup_logging() is idempotent — subsequent calls for the same
     # process_name are no-ops, so this pays no cost after the first chapter.
@@ -548,6 +573,7 @@ def _finalise_chapter(
 
 __all__ = [
     "get_batch_info",
+    "init_worker",
     "worker_process_chapter",
     "_pause_for_segment",
     "_is_scene_break",
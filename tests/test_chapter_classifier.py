@@ -148,3 +148,27 @@ class TestCustomPatterns:
         # After reset, prologue should be treated as a regular chapter
         tags = ChapterClassifier.classify("Prologue")
         assert tags.is_front_matter is False
+
+    def test_custom_pattern_without_inline_flag(self):
+        ChapterClassifier.add_custom_pattern("back_matter", r"^coda$", "coda")
+        assert ChapterClassifier.classify("Coda").is_back_matter is True
+
+    def test_uncombinable_custom_patterns_still_match(self):
+        # Duplicate group names and numbered backreferences cannot be joined
+        # into one alternation; classify() falls back to per-pattern matching.
+        ChapterClassifier.add_custom_pattern("back_matter", r"^(?P<w>coda)", "a")
+        ChapterClassifier.add_custom_pattern("back_matter", r"^(?P<w>envoi)", "b")
+        ChapterClassifier.add_custom_pattern("title_page", r"^(\w+) \1$", "c")
+        assert ChapterClassifier.classify("Envoi").is_back_matter is True
+        assert ChapterClassifier.classify("Half half").is_title_page is True
+        assert ChapterClassifier.classify("Cover").is_title_page is True
+
+    def test_custom_pattern_applies_to_previously_classified_title(self):
+        assert ChapterClassifier.classify("Prologue").is_front_matter is False
+        ChapterClassifier.add_custom_pattern("front_matter", r"(?i)^prologue", "prologue")
+        assert ChapterClassifier.classify("Prologue").is_front_matter is True
+
+    def test_pattern_list_changed_directly_applies_to_classified_title(self):
+        assert ChapterClassifier.classify("Interlude").is_part_divider is False
+        ChapterClassifier.PART_DIVIDER_PATTERNS.append((r"(?i)^interlude", "interlude"))
+        assert ChapterClassifier.classify("Interlude").is_part_divider is True
@@ -1,11 +1,23 @@
 """Tests for kenkui parsing functionality."""
 
+import importlib
+import subprocess
+import threading
+import time
+import wave
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import imageio_ffmpeg
 import pytest
+from lxml import etree
 
-from kenkui.models import Chapter
+import kenkui.parsing as parsing
+from kenkui.models import AudioResult, Chapter, ProcessingConfig
+from kenkui.readers import EbookReader, Registry, epub, fb2
 from kenkui.readers.epub import EpubReader
+from kenkui.readers.fb2 import FB2_NS, Fb2Reader
 
 TEST_EPUB = Path("src/kenkui/samples/Les Miserables - Victor Hugo.epub")
 
@@ -50,6 +62,129 @@ class TestEpubReader:
                 assert isinstance(chapter.title, str)
                 assert isinstance(chapter.paragraphs, list)
 
+    def test_toc_and_metadata_are_cached(self, reader):
+        """Repeated TOC and metadata queries reuse the first result."""
+        toc = reader.get_toc()
+        assert reader.get_toc() is toc
+        assert reader.count_chapters() == len(toc)
+        assert reader.get_metadata() is reader.get_metadata()
+
+    def test_stream_ncx_keeps_document_order(self):
+        """Nested navPoints are returned in reading order, not closing order."""
+        ncx = b"""<?xml version="1.0"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/"><navMap>
+  <navPoint><navLabel><text>Part One</text></navLabel><content src="p1.xhtml"/>
+    <navPoint><navLabel><text>Chapter 1</text></navLabel><content src="c1.xhtml#a"/></navPoint>
+  </navPoint>
+  <navPoint><navLabel><text>Part Two</text></navLabel><content src="p2.xhtml"/></navPoint>
+</navMap></ncx>"""
+        entries = EpubReader._stream_ncx(ncx)
+        assert [e["title"] for e in entries] == ["Part One", "Chapter 1", "Part Two"]
+        assert entries[1]["href"] == "c1.xhtml"
+        assert entries[1]["src"] == "c1.xhtml#a"
+
+    def test_ncx_leaves_skip_nested_and_parent_points(self):
+        """The fallback title map keeps only top-level navPoints with no children."""
+        ncx = b"""<?xml version="1.0"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/"><navMap>
+  <navPoint><navLabel><text>Part One</text></navLabel><content src="p1.xhtml"/>
+    <navPoint><navLabel><text>Chapter 1</text></navLabel><content src="c1.xhtml"/></navPoint>
+  </navPoint>
+  <navPoint><navLabel><text>Epilogue</text></navLabel><content src="e.xhtml#top"/></navPoint>
+</navMap></ncx>"""
+        assert EpubReader._stream_ncx_leaves(ncx) == {"e.xhtml": "Epilogue"}
+
+    def test_anchor_split_keeps_every_block(self):
+        """Chapters sharing a file keep all blocks up to the next anchor."""
+        html = (
+            b"<html><body><h2 id='a'>A</h2><p>one</p><p>two</p>"
+            b"<h2 id='b'>B</h2><p>three</p><p>four</p></body></html>"
+        )
+        paragraphs = EpubReader._extract_item_paragraphs(html, [("a", 0), ("b", 1)])
+        assert paragraphs == {0: ["one", "two"], 1: ["three", "four"]}
+
+    def test_item_text_skips_noise_and_marks_italics(self):
+        """Noise tags are dropped and italic runs are wrapped in markers."""
+        html = (
+            b"<html><body><h2 id='a'>A</h2><p>word<sup>1</sup>, next <i>aside</i></p>"
+            b"<!-- note --><p><span class='pagenumber'>12</span>kan<ruby>k<rt>x</rt></ruby></p>"
+            b"<h2 id='b'>B</h2><div>\n\n</div><pre>  kept  </pre><p>end</p></body></html>"
+        )
+        first = ["word , next \x02aside\x03", "kan k x"]
+        paragraphs = EpubReader._extract_item_paragraphs(html, [("a", 0), ("b", 1)])
+        assert paragraphs == {0: first, 1: ["end"]}
+        assert EpubReader._extract_item_paragraphs(html, [(None, 0)]) == {0: [*first, "end"]}
+
+    def test_item_in_declared_charset(self):
+        """Items that are not UTF-8 are read in the charset they declare."""
+        html = (
+            '<html><head><meta charset="windows-1251"/></head>'
+            "<body><p>Привет, мир</p></body></html>"
+        ).encode("cp1251")
+        assert EpubReader._extract_item_paragraphs(html, [(None, 0)]) == {0: ["Привет, мир"]}
+
+    def test_manifest_item_is_document(self):
+        """Only (X)HTML manifest items are handed to the HTML parser."""
+        from kenkui.readers.epub import _ManifestItem
+
+        def item(href, media_type):
+            return _ManifestItem("x", href, media_type, None)
+
+        assert item("ch1.xhtml", "application/xhtml+xml").is_document
+        assert item("ch1.html", "text/html; charset=utf-8").is_document
+        assert not item("style.css", "text/css").is_document
+        assert not item("cover.jpg", "image/jpeg").is_document
+        assert item("ch1.XHTML", None).is_document
+
+    def test_epub3_nav_toc(self, tmp_path):
+        """A NAV-only EPUB3 yields a nested TOC with OPF-relative hrefs."""
+        nav = """<html xmlns="http://www.w3.org/1999/xhtml"
+  xmlns:epub="http://www.idpf.org/2007/ops"><body><nav epub:type="toc"><ol>
+  <li><a href="../text/p1.xhtml">Part <b>One</b></a>
+    <ol><li><a href="../text/c1.xhtml#s1">Chapter 1</a></li></ol></li>
+  <li><span>Unlinked</span><ol><li><a href="../text/c2.xhtml">Chapter 2</a></li></ol></li>
+</ol></nav></body></html>"""
+        opf = """<package xmlns="http://www.idpf.org/2007/opf" version="3.0"><manifest>
+  <item id="nav" href="nav/nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
+</manifest><spine/></package>"""
+        container = """<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles><rootfile full-path="OEBPS/content.opf"/></rootfiles></container>"""
+        path = tmp_path / "nav.epub"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("META-INF/container.xml", container)
+            zf.writestr("OEBPS/content.opf", opf)
+            zf.writestr("OEBPS/nav/nav.xhtml", nav)
+
+        with EpubReader(path) as reader:
+            toc = reader.get_toc()
+        assert [(e.title, e.href, e.level) for e in toc] == [
+            ("Part One", "text/p1.xhtml", 0),
+            ("Chapter 1", "text/c1.xhtml", 1),
+            ("Chapter 2", "text/c2.xhtml", 1),
+        ]
+
+    def test_zip_without_package_raises(self, tmp_path):
+        """A ZIP with no container/OPF is rejected at construction."""
+        bogus = tmp_path / "bogus.epub"
+        with zipfile.ZipFile(bogus, "w") as zf:
+            zf.writestr("mimetype", "application/epub+zip")
+        with pytest.raises(ValueError):
+            EpubReader(bogus)
+
+
+    def test_parse_pool_failure_falls_back_to_serial(self, monkeypatch):
+        """An opted-in pool that cannot run leaves the chapters unchanged."""
+
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                raise TypeError("cannot pickle")
+
+        expected = [c.paragraphs for c in EpubReader(TEST_EPUB).get_chapters()]
+        monkeypatch.setattr(epub, "ProcessPoolExecutor", BrokenPool)
+        monkeypatch.setattr(epub, "_PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(EpubReader, "PARSE_WORKERS", 2)
+
+        assert [c.paragraphs for c in EpubReader(TEST_EPUB).get_chapters()] == expected
 
 class TestChapterDataclass:
     """Tests for the Chapter dataclass."""
@@ -68,3 +203,441 @@ class TestChapterDataclass:
         chapter = Chapter(index=2, title="Empty Chapter", paragraphs=[])
         assert chapter.index == 2
         assert chapter.paragraphs == []
+
+
+
+
+class TestRegistry:
+    """Tests for the lazily populated reader registry."""
+
+    def test_resolves_lazily_imported_readers(self):
+        """Readers are imported on first lookup but all extensions are advertised."""
+        assert ".mobi" in Registry.supported_extensions()
+        assert Registry.is_supported(Path("book.azw3"))
+        assert Registry.get_reader_class(Path("book.fb2")) is fb2.Fb2Reader
+        assert Registry.get_reader_class(Path("book.txt")) is None
+
+    def test_lazy_map_matches_reader_extensions(self):
+        """Each lazily imported module is listed under exactly its readers' extensions."""
+        for module_name in set(Registry._modules.values()):
+            module = importlib.import_module(module_name, "kenkui.readers")
+            declared = {
+                ext
+                for obj in vars(module).values()
+                if isinstance(obj, type)
+                and issubclass(obj, EbookReader)
+                and obj.__module__ == module.__name__
+                for ext in obj.SUPPORTED_EXTENSIONS
+            }
+            mapped = {ext for ext, name in Registry._modules.items() if name == module_name}
+            assert mapped == declared, module_name
+
+    def test_resolves_double_extension(self):
+        """A zipped FB2 resolves through its whole ``.fb2.zip`` extension."""
+        assert Registry.is_supported(Path("War.And.Peace.FB2.ZIP"))
+        assert Registry.get_reader_class(Path("book.fb2.zip")) is fb2.Fb2Reader
+        assert Registry.get_reader_class(Path("vol.2.epub")) is epub.EpubReader
+        assert not Registry.is_supported(Path("photos.zip"))
+
+
+_FB2_TEXT = "<p>" + "Words enough to pass the minimum chapter length. " * 2 + "</p>"
+FB2_BOOK = f"""<?xml version="1.0" encoding="utf-8"?>
+<FictionBook xmlns="http://www.gribuser.ru/xml/fictionbook/2/0"><description><title-info>
+  <author><first-name>Leo</first-name><last-name>Tolstoy</last-name></author>
+  <book-title>War</book-title><lang>ru</lang></title-info></description>
+<body><title><p>War</p></title>
+  <section><title><p>Part 1</p></title>
+    <section><title><p>Ch 1</p></title>{_FB2_TEXT}</section>
+    <section><title><p>Ch 2</p></title>{_FB2_TEXT}</section></section>
+  <section><title><p>Part 2</p></title>
+    <section><title><p>Ch 3</p></title><section><title><p>Deep</p></title>{_FB2_TEXT}</section>
+    </section></section>
+  <section>{_FB2_TEXT}</section>
+</body><body name="notes"><section><title><p>Note</p></title>{_FB2_TEXT}</section></body>
+</FictionBook>"""
+_FB2_TOC = (
+    '<toc><link href="#c1"><p>Opening</p></link><link href="#c2"><p>Close</p></link></toc>'
+)
+
+
+class TestFb2Reader:
+    """Tests for the Fb2Reader class."""
+
+    @pytest.fixture
+    def book(self, tmp_path):
+        """Path of the sample FB2 book; tests may overwrite its contents."""
+        path = tmp_path / "book.fb2"
+        path.write_text(FB2_BOOK, encoding="utf-8")
+        return path
+
+    def test_streaming_matches_tree(self, book, monkeypatch):
+        """Large books are streamed, yielding the same metadata, TOC and chapters."""
+
+        def read():
+            reader = Fb2Reader(book)
+            chapters = [(c.index, c.title, c.paragraphs) for c in reader.get_chapters()]
+            toc = [(e.title, e.level) for e in reader.get_toc()]
+            return reader.get_metadata(), toc, chapters
+
+        metadata, toc, chapters = read()
+        monkeypatch.setattr(Fb2Reader, "STREAM_THRESHOLD", 0)
+        assert read() == (metadata, toc, chapters)
+        assert toc == [
+            ("Part 1", 0),
+            ("Ch 1", 1),
+            ("Ch 2", 1),
+            ("Part 2", 0),
+            ("Ch 3", 1),
+            ("Deep", 2),
+            ("Note", 0),
+        ]
+        assert (metadata.title, metadata.author) == ("War", "Leo Tolstoy")
+        assert [title for _, title, _ in chapters] == [
+            "Part 1: Ch 1",
+            "Part 1: Ch 2",
+            "Part 2: Ch 3: Deep",
+            "Section 4",
+        ]
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            (FB2_BOOK.replace("</title-info>", f"</title-info>{_FB2_TOC}"), ["Opening", "Close"]),
+            (
+                FB2_BOOK.replace("<p>Ch 2</p></title>", f"<p>Ch 2</p></title>{_FB2_TOC}"),
+                ["Opening", "Close"],
+            ),
+            # Only the first <toc> is read; without links, sections are used.
+            (
+                FB2_BOOK.replace("</title-info>", "</title-info><toc/>").replace(
+                    "<p>Ch 2</p></title>", f"<p>Ch 2</p></title>{_FB2_TOC}"
+                ),
+                ["Part 1", "Ch 1", "Ch 2", "Part 2", "Ch 3", "Deep", "Note"],
+            ),
+        ],
+    )
+    def test_streaming_reads_toc_element(self, book, monkeypatch, text, expected):
+        """A <toc> element gives the same TOC whether or not the book is streamed."""
+        book.write_text(text, encoding="utf-8")
+
+        toc = [(e.title, e.href) for e in Fb2Reader(book).get_toc()]
+        monkeypatch.setattr(Fb2Reader, "STREAM_THRESHOLD", 0)
+        assert [(e.title, e.href) for e in Fb2Reader(book).get_toc()] == toc
+        assert [title for title, _ in toc] == expected
+
+    def test_metadata_reads_only_description(self, book):
+        """Metadata comes from <description> alone; the body is parsed on demand."""
+        reader = Fb2Reader(book)
+
+        assert reader.get_metadata().title == "War"
+        assert not reader._full_parsed
+        assert len(reader.get_chapters()) == 4
+
+    def test_chapters_are_leaf_sections(self, book):
+        """Each leaf section of the main body becomes exactly one chapter."""
+        body = etree.parse(str(book)).getroot().find("fb:body", FB2_NS)
+        leaves = [
+            s
+            for s in body.iterfind(".//fb:section", FB2_NS)
+            if s.find("fb:section", FB2_NS) is None
+        ]
+
+        assert len(Fb2Reader(book).get_chapters()) == len(leaves) == 4
+
+    def test_declared_encoding(self, book):
+        """The encoding named in the XML declaration is used to decode the book."""
+        text = FB2_BOOK.replace('encoding="utf-8"', 'encoding="windows-1251"')
+        book.write_bytes(text.replace("<book-title>War", "<book-title>Война").encode("cp1251"))
+
+        assert Fb2Reader(book).get_metadata().title == "Война"
+
+    def test_cover_next_to_book(self, book, tmp_path):
+        """A book-named cover beats a generic one; empty files are ignored."""
+        (tmp_path / "book-cover.jpg").write_bytes(b"")
+        (tmp_path / "cover.jpg").write_bytes(b"generic")
+        (tmp_path / "book-cover.png").write_bytes(b"named")
+
+        assert Fb2Reader(book).get_cover() == (b"generic", "image/jpeg")
+        (tmp_path / "cover.jpg").unlink()
+        assert Fb2Reader(book).get_cover() == (b"named", "image/png")
+
+    def test_zip_cover_prefers_cover_file_name(self, tmp_path):
+        """In a zipped book, an image named cover* beats an earlier *cover* match."""
+        path = tmp_path / "book.fb2.zip"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("book.fb2", FB2_BOOK)
+            zf.writestr("images/backcover.jpg", b"back")
+            zf.writestr("images/Cover.png", b"front")
+
+        assert Fb2Reader(path).get_cover() == (b"front", "image/png")
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("book.fb2", FB2_BOOK)
+            zf.writestr("images/backcover.jpg", b"back")
+        assert Fb2Reader(path).get_cover() == (b"back", "image/jpeg")
+
+    def test_without_namespace(self, book, tmp_path):
+        """Books that declare no FictionBook namespace are read the same way."""
+        plain = tmp_path / "plain.fb2"
+        plain.write_text(
+            FB2_BOOK.replace(' xmlns="http://www.gribuser.ru/xml/fictionbook/2/0"', ""),
+            encoding="utf-8",
+        )
+
+        reader, expected = Fb2Reader(plain), Fb2Reader(book)
+        assert reader.get_metadata() == expected.get_metadata()
+        assert [c.title for c in reader.get_chapters()] == [
+            c.title for c in expected.get_chapters()
+        ]
+        assert len(reader.get_chapters()) == 4
+
+
+_MOBI_TEXT = "Words enough to pass the minimum chapter length. " * 2
+
+
+class TestMobiReader:
+    """Tests for the MobiReader class, over HTML files standing in for a book."""
+
+    @pytest.fixture
+    def make_reader(self, tmp_path, monkeypatch):
+        """Return a function opening a MobiReader over the given files."""
+        mobi = pytest.importorskip("mobi")
+        from kenkui.readers.mobi import MobiReader
+
+        def make(files: dict[str, str]):
+            def extract(_src, temp_dir):
+                for name, text in files.items():
+                    (Path(temp_dir) / name).write_text(text, encoding="utf-8")
+                return temp_dir, None
+
+            monkeypatch.setattr(mobi, "extract", extract)
+            return MobiReader(tmp_path / "book.mobi")
+
+        return make
+
+    def test_paragraphs_skip_removed_wrappers(self, make_reader):
+        """Blocks inside navigation or footnote wrappers are not read as text."""
+        reader = make_reader(
+            {
+                "part1.html": "<html><head><title>Book</title></head><body>"
+                "<nav><p>Contents</p></nav><aside class='footnote'><p>Note</p></aside>"
+                f"<section><p>{_MOBI_TEXT}</p><div>Second <i>part</i></div></section>"
+                "</body></html>"
+            }
+        )
+
+        assert reader.get_metadata().title == "Book"
+        [chapter] = reader.get_chapters()
+        assert chapter.paragraphs == [_MOBI_TEXT.strip(), "Second \x02part\x03"]
+
+    def test_toc_file_found_in_any_case(self, make_reader):
+        """A TOC document is picked up whatever the case of its name."""
+        reader = make_reader(
+            {
+                "Book_TOC.xhtml": "<a href='part1.html'>Opening</a>",
+                "part1.html": f"<p>{_MOBI_TEXT}</p>",
+            }
+        )
+
+        assert [(e.title, e.href) for e in reader.get_toc()] == [("Opening", "part1.html")]
+        assert [c.title for c in reader.get_chapters()] == ["Opening"]
+
+    def test_toc_href_names_its_file(self, make_reader):
+        """A TOC href picks the file it names, not one whose name contains it."""
+        reader = make_reader(
+            {
+                "toc.html": "<a href='part1.html'>One</a>",
+                "apart1.html": f"<p>Wrong. {_MOBI_TEXT}</p>",
+                "part1.html": f"<p>Right. {_MOBI_TEXT}</p>",
+            }
+        )
+
+        [chapter] = reader.get_chapters()
+        assert chapter.paragraphs[0].startswith("Right.")
+
+    def test_unreadable_stream_falls_back_to_soup(self, make_reader, monkeypatch):
+        """HTML the lxml stream rejects, even part way through, is read with BeautifulSoup."""
+        from kenkui.readers import mobi
+
+        html = f"<p>{_MOBI_TEXT}</p><div>Second <i>part</i></div>"
+        reader = make_reader({"part1.html": html})
+        expected = reader._extract_paragraphs(html)
+        stream_blocks = mobi._stream_blocks
+
+        def broken(html_content):
+            yield next(stream_blocks(html_content))
+            raise etree.XMLSyntaxError("bad markup", None, 1, 1)
+
+        monkeypatch.setattr(mobi, "_stream_blocks", broken)
+        assert expected == [_MOBI_TEXT.strip(), "Second \x02part\x03"]
+        assert reader._extract_paragraphs(html) == expected
+
+
+def _write_wav(path: Path, frames: bytes, rate: int = 24000) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(frames)
+
+
+@pytest.fixture
+def make_builder(tmp_path):
+    """Return a function building an AudioBuilder that works in *tmp_path*."""
+
+    def make(workers: int = 1) -> parsing.AudioBuilder:
+        cfg = ProcessingConfig(
+            voice="alba",
+            ebook_path=tmp_path / "book.epub",
+            output_path=tmp_path,
+            pause_line_ms=0,
+            pause_chapter_ms=0,
+            workers=workers,
+            m4b_bitrate="64k",
+            keep_temp=False,
+            debug_html=False,
+            chapter_filters=[],
+        )
+        builder = parsing.AudioBuilder(cfg)
+        builder.temp_dir = tmp_path
+        return builder
+
+    return make
+
+
+class TestStitch:
+    """Tests for merging chapter audio and cleaning up after it."""
+
+    def test_concat_wav_joins_pcm_payloads(self, tmp_path):
+        """Same-format WAV fragments are merged into one valid WAV file."""
+        parts = [tmp_path / "a.wav", tmp_path / "b.wav"]
+        _write_wav(parts[0], b"\x01\x00" * 10)
+        _write_wav(parts[1], b"\x02\x00" * 5)
+        out = tmp_path / "out.wav"
+
+        assert parsing._concat_wav(parts, out)
+        with wave.open(str(out), "rb") as w:
+            assert w.getframerate() == 24000
+            assert w.readframes(w.getnframes()) == b"\x01\x00" * 10 + b"\x02\x00" * 5
+
+    def test_concat_wav_rejects_mixed_formats(self, tmp_path):
+        """Fragments with different sample rates are left to ffmpeg."""
+        parts = [tmp_path / "a.wav", tmp_path / "b.wav"]
+        _write_wav(parts[0], b"\x00\x00", rate=24000)
+        _write_wav(parts[1], b"\x00\x00", rate=44100)
+
+        assert not parsing._concat_wav(parts, tmp_path / "out.wav")
+        assert not (tmp_path / "out.wav").exists()
+
+    def test_stitch_files_keeps_every_fragment_group(self, tmp_path, monkeypatch, make_builder):
+        """Books split into several merge groups encode to their full length."""
+        monkeypatch.setattr(parsing, "_STITCH_GROUP_SIZE", 2)
+        results = []
+        for n in range(7):
+            part = tmp_path / f"{n}.wav"
+            _write_wav(part, b"\x00\x00" * 24000)
+            results.append(AudioResult(n + 1, f"Chapter {n + 1}", part, 1000))
+
+        output = tmp_path / "book.m4b"
+        make_builder()._stitch_files(results, output)
+        decoded = tmp_path / "decoded.wav"
+        subprocess.run(
+            [imageio_ffmpeg.get_ffmpeg_exe(), "-v", "error", "-i", str(output), str(decoded)],
+            check=True,
+        )
+
+        assert len(list(tmp_path.glob("stitch_*"))) == 4
+        with wave.open(str(decoded)) as w:
+            assert w.getnframes() / w.getframerate() == pytest.approx(7.0, abs=0.1)
+
+    def test_fast_rmtree_removes_tree_but_not_link_targets(self, tmp_path):
+        """Nested dirs go; symlinked directories are unlinked, not descended."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.wav").write_bytes(b"x")
+        root = tmp_path / "temp"
+        (root / "sub").mkdir(parents=True)
+        (root / "ch_0001.wav").write_bytes(b"x")
+        (root / "sub" / "part.wav").write_bytes(b"x")
+        (root / "link").symlink_to(outside, target_is_directory=True)
+
+        parsing._fast_rmtree(root)
+
+        assert not root.exists()
+        assert (outside / "keep.wav").exists()
+
+
+class TestChapterPool:
+    """Tests for AudioBuilder._process_chapters, run on threads with a stub worker."""
+
+    @pytest.fixture
+    def pool(self, monkeypatch, make_builder):
+        """Return a function building an AudioBuilder whose pool runs *worker*.
+
+        The function also returns a dict tracking how many chapters were
+        queued in the pool at once.
+        """
+
+        def make(worker, workers: int = 2):
+            counts = {"in_flight": 0, "peak": 0}
+            lock = threading.Lock()
+
+            def finished(_future):
+                with lock:
+                    counts["in_flight"] -= 1
+
+            class CountingPool(ThreadPoolExecutor):
+                def submit(self, *args, **kwargs):
+                    with lock:
+                        counts["in_flight"] += 1
+                        counts["peak"] = max(counts["peak"], counts["in_flight"])
+                    future = super().submit(*args, **kwargs)
+                    future.add_done_callback(finished)
+                    return future
+
+            queues = []
+            monkeypatch.setattr(parsing, "ProcessPoolExecutor", CountingPool)
+            monkeypatch.setattr(parsing, "init_worker", lambda queue, _cfg: queues.append(queue))
+            monkeypatch.setattr(
+                parsing,
+                "worker_process_chapter",
+                lambda ch, _cfg, temp_dir, _queue, _first: worker(queues[0], ch, temp_dir),
+            )
+            return make_builder(workers), counts
+
+        return make
+
+    @staticmethod
+    def chapters(count: int) -> list[Chapter]:
+        return [Chapter(index=n, title=f"Chapter {n}", paragraphs=["x"]) for n in range(count)]
+
+    def test_keeps_order_and_caps_in_flight(self, pool, capsys):
+        """Results keep chapter order, the pool queue stays capped, errors are reported."""
+
+        def worker(queue, ch, temp_dir):
+            pid = threading.get_ident()
+            queue.put(("START", pid, ch.title, 1, 10))
+            # Later chapters often finish first.
+            time.sleep(0.01 * (3 - ch.index % 3))
+            if ch.index == 3:
+                queue.put(("ERROR", pid, ch.title, "ValueError: bad text", "traceback"))
+                return None
+            queue.put(("DONE", pid))
+            return AudioResult(ch.index, ch.title, temp_dir / f"{ch.index}.wav", 1000)
+
+        builder, counts = pool(worker)
+        results = builder._process_chapters(self.chapters(10), {}, 10, 100)
+
+        assert [r.chapter_index for r in results] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        # Two workers, two chapters each.
+        assert 0 < counts["peak"] <= 4
+        assert "Chapter 3: ValueError: bad text" in capsys.readouterr().out
+
+    def test_raising_worker_does_not_hang(self, pool):
+        """An exception escaping the worker ends the loop and reaches the caller."""
+
+        def worker(queue, ch, temp_dir):
+            raise RuntimeError(f"crashed on {ch.title}")
+
+        builder, _ = pool(worker, workers=1)
+        with pytest.raises(RuntimeError, match="crashed on Chapter 0"):
+            builder._process_chapters(self.chapters(3), {}, 3, 30)
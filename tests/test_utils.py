@@ -1,11 +1,13 @@
-"""Tests for kenkui.utils — batch_text and _normalize_bitrate."""
+"""Tests for kenkui.utils — batch_text, _normalize_bitrate and EPUB covers."""
 
 from __future__ import annotations
 
+import zipfile
+
 import pytest
 
 from kenkui.models import _normalize_bitrate
-from kenkui.utils import batch_text
+from kenkui.utils import batch_text, extract_epub_cover
 
 # ---------------------------------------------------------------------------
 # batch_text
@@ -111,3 +113,60 @@ class TestNormalizeBitrate:
     def test_custom_default(self):
         assert _normalize_bitrate(None, default="128k") == "128k"
         assert _normalize_bitrate("", default="64k") == "64k"
+
+
+# ---------------------------------------------------------------------------
+# extract_epub_cover
+# ---------------------------------------------------------------------------
+
+_CONTAINER = """<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles><rootfile full-path="OEBPS/content.opf"/></rootfiles></container>"""
+
+
+class TestExtractEpubCover:
+    """The cover is the manifest item the OPF names, read relative to the OPF."""
+
+    @pytest.fixture
+    def make_epub(self, tmp_path):
+        def make(metadata: str, manifest: str):
+            opf = (
+                '<package xmlns="http://www.idpf.org/2007/opf" version="3.0">'
+                f"<metadata>{metadata}</metadata><manifest>{manifest}</manifest></package>"
+            )
+            path = tmp_path / "book.epub"
+            with zipfile.ZipFile(path, "w") as zf:
+                zf.writestr("META-INF/container.xml", _CONTAINER)
+                zf.writestr("OEBPS/content.opf", opf)
+                zf.writestr("OEBPS/images/front.png", b"front")
+                zf.writestr("OEBPS/images/back.jpg", b"back")
+            return path
+
+        return make
+
+    def test_meta_name_cover(self, make_epub):
+        path = make_epub(
+            '<meta name="cover" content="img2"/>',
+            '<item id="img1" href="images/back.jpg" media-type="image/jpeg"/>'
+            '<item id="img2" href="images/front.png" media-type="image/png"/>',
+        )
+        assert extract_epub_cover(path) == (b"front", "image/png")
+
+    def test_cover_image_property(self, make_epub):
+        path = make_epub(
+            "",
+            '<item id="img1" href="images/back.jpg" media-type="image/jpeg"/>'
+            '<item id="img2" href="images/front.png" properties="cover-image"/>',
+        )
+        # No media-type: guessed from the extension.
+        assert extract_epub_cover(path) == (b"front", "image/png")
+
+    def test_item_without_href_is_skipped(self, make_epub):
+        path = make_epub(
+            '<meta name="cover" content="img"/>',
+            '<item id="img" media-type="image/jpeg"/>'
+            '<item id="img" href="images/front.png" media-type="image/png"/>',
+        )
+        assert extract_epub_cover(path) == (b"front", "image/png")
+
+    def test_missing_epub(self, tmp_path):
+        assert extract_epub_cover(tmp_path / "missing.epub") == (None, None)